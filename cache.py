@@ -4,13 +4,16 @@ HexClaw — cache.py
 Two-tier inference cache sitting in front of every LLM call.
 
 Tier 1 — Exact match (Redis, DB 0)
-  Key   : "exact:{sha256(prompt)}"
+  Key   : "exact:{sha256(prompt)}", over the normalised (system, prompt)
   Value : JSON-serialised LLM response string
   TTL   : CACHE_EXACT_TTL seconds (default 86400 — 1 day)
 
-Tier 2 — Semantic match (Redis, DB 1)
-  Stores prompt embeddings as Redis hash fields.
+Tier 2 — Semantic match (Redis, DB 1; in-process fallback)
+  Stores prompt embeddings as Redis hash fields. Without Redis, and with
+  CACHE_SEMANTIC_LOCAL=1, the same lookup runs over a process-local index
+  (CACHE_SEMANTIC_MAX_ENTRIES, TTL).
   On lookup, computes cosine similarity against all stored embeddings
+  (one matrix-vector product over an in-process copy of the vectors)
   and returns the cached response if similarity ≥ CACHE_SEMANTIC_THRESHOLD.
   Embedding generation: uses numpy only (dot-product on character n-gram
   frequency vector) when sentence-transformers not available, so the cache
@@ -35,16 +38,17 @@ Usage:
 
 from __future__ import annotations
 
+import base64
+import functools
 import hashlib
 import json
 import logging
 import os
+import threading
 import time
 from typing import Any
 
-from dotenv import load_dotenv
-
-load_dotenv()
+import config  # noqa: F401 — loads .env on import
 
 log = logging.getLogger("hexclaw.cache")
 
@@ -59,6 +63,10 @@ CACHE_EXACT_TTL: int = int(os.getenv("CACHE_EXACT_TTL", str(86_400)))       # 1
 CACHE_SEMANTIC_TTL: int = int(os.getenv("CACHE_SEMANTIC_TTL", str(604_800))) # 7 days
 CACHE_SEMANTIC_THRESHOLD: float = float(os.getenv("CACHE_SEMANTIC_THRESHOLD", "0.92"))
 CACHE_SEMANTIC_MAX_ENTRIES: int = int(os.getenv("CACHE_SEMANTIC_MAX_ENTRIES", "2000"))
+# Opt-in in-process semantic tier when Redis is down. Off by default: with the
+# n-gram embedder, short prompts behind a long shared prefix (e.g. T2S
+# templates) can clear the threshold while asking different questions.
+CACHE_SEMANTIC_LOCAL: bool = bool(int(os.getenv("CACHE_SEMANTIC_LOCAL", "0")))
 
 # Embedding dimension when using the lightweight built-in encoder
 _EMBED_DIM = 256
@@ -125,13 +133,11 @@ def _ngram_embed(text: str, dim: int = _EMBED_DIM) -> list[float]:
     import numpy as np
 
     text = text.lower()[:2048]  # cap for speed
-    vec = np.zeros(dim, dtype=np.float32)
 
-    # Hash each trigram into one of the dim buckets
-    for i in range(len(text) - 2):
-        trigram = text[i:i+3]
-        bucket = int(hashlib.md5(trigram.encode()).hexdigest(), 16) % dim
-        vec[bucket] += 1.0
+    # Hash each trigram into one of the dim buckets (memoised — prompts share
+    # most trigrams), then count them in one vectorised bincount
+    buckets = [_trigram_bucket(text[i:i+3], dim) for i in range(len(text) - 2)]
+    vec = np.bincount(buckets, minlength=dim).astype(np.float32)
 
     # L2 norm
     norm = np.linalg.norm(vec)
@@ -141,14 +147,39 @@ def _ngram_embed(text: str, dim: int = _EMBED_DIM) -> list[float]:
     return vec.tolist()
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
-    """Cosine similarity between two equal-length vectors."""
+@functools.lru_cache(maxsize=65_536)
+def _trigram_bucket(trigram: str, dim: int) -> int:
+    return int(hashlib.md5(trigram.encode()).hexdigest(), 16) % dim
+
+
+def _normalise(text: str) -> str:
+    """
+    Canonical cache form of a prompt: outer whitespace stripped, CRLF and
+    trailing spaces per line dropped. Indentation is kept — prompts carry code.
+    """
+    text = text.strip()
+    if "\r" in text or " \n" in text or "\t\n" in text:
+        text = "\n".join(line.rstrip() for line in text.splitlines())
+    return text
+
+
+def _join(prompt: str, system: str | None) -> str:
+    """Full cache text for a (system, prompt) pair."""
+    return prompt if system is None else f"{system}\n\n{prompt}"
+
+
+def _pack_vec(vec: list[float]) -> str:
+    """Encode an embedding as base64 float32 bytes (~3x smaller, no float parsing)."""
+    import numpy as np
+    return base64.b64encode(np.asarray(vec, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def _unpack_vec(raw: str) -> Any:
+    """Decode a stored embedding; entries written before _pack_vec are JSON lists."""
     import numpy as np
-    va, vb = np.array(a, dtype=np.float32), np.array(b, dtype=np.float32)
-    denom = np.linalg.norm(va) * np.linalg.norm(vb)
-    if denom == 0:
-        return 0.0
-    return float(np.dot(va, vb) / denom)
+    if raw.startswith("["):
+        return np.asarray(json.loads(raw), dtype=np.float32)
+    return np.frombuffer(base64.b64decode(raw), dtype=np.float32)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -206,43 +237,64 @@ class Cache:
         self._hits_exact = 0
         self._hits_semantic = 0
         self._misses = 0
+        # In-process mirror of the semantic index: entry ids plus one contiguous
+        # (n, dim) float32 matrix, reloaded only when sem:index changes
+        self._sem_sig: tuple | None = None
+        self._sem_ids: list[str] = []
+        self._sem_matrix: Any = None
+        # Without Redis DB 1 the semantic tier lives in-process only:
+        # entry_id -> (response, expires_at), vectors in _sem_ids/_sem_matrix
+        self._local_sem: dict[str, tuple[str, float]] = {}
+        # Guards _sem_ids/_sem_matrix: check()/store() may run on worker threads
+        self._sem_lock = threading.Lock()
 
     # ── Public API ────────────────────────────────────────────────────────
 
-    def check(self, prompt: str) -> str | None:
+    def check(self, prompt: str, system: str | None = None) -> str | None:
         """
         Check both cache tiers for *prompt*.
 
+        With *system*, the entry is keyed as if on f"{system}\n\n{prompt}", but
+        the exact-tier key is hashed from the parts; the joined text is only
+        built when the semantic tier actually runs. Both are normalised first,
+        so variants differing only in outer/trailing whitespace share an entry.
+
         Returns the cached response string on hit, None on miss.
         PRD rule: always call this before inference.ask().
         """
+        prompt = _normalise(prompt)
+        system = _normalise(system) if system is not None else None
+
         # Tier 1 — exact
-        result = self._check_exact(prompt)
+        result = self._check_exact(prompt, system)
         if result is not None:
             self._hits_exact += 1
             log.debug("Cache HIT (exact): %.60s...", prompt)
             return result
 
         # Tier 2 — semantic
-        result = self._check_semantic(prompt)
+        result = self._check_semantic(_join(prompt, system)) if self._semantic_active() else None
         if result is not None:
             self._hits_semantic += 1
             log.debug("Cache HIT (semantic): %.60s...", prompt)
             # Promote to exact cache for future identical calls
-            self._store_exact(prompt, result)
+            self._store_exact(prompt, result, system)
             return result
 
         self._misses += 1
         log.debug("Cache MISS: %.60s...", prompt)
         return None
 
-    def store(self, prompt: str, response: str) -> None:
+    def store(self, prompt: str, response: str, system: str | None = None) -> None:
         """
         Store a (prompt, response) pair in both tiers.
         Call this after every successful LLM response.
         """
-        self._store_exact(prompt, response)
-        self._store_semantic(prompt, response)
+        prompt = _normalise(prompt)
+        system = _normalise(system) if system is not None else None
+        self._store_exact(prompt, response, system)
+        if self._semantic_active():
+            self._store_semantic(_join(prompt, system), response)
 
     def stats(self) -> dict[str, Any]:
         """Return runtime statistics (no Redis calls)."""
@@ -257,6 +309,7 @@ class Cache:
             "embed_backend": _EMBED_BACKEND,
             "redis_exact":   self._r_exact is not None,
             "redis_semantic": self._r_sem is not None,
+            "semantic_entries_local": len(self._local_sem),
         }
 
     def flush_exact(self) -> int:
@@ -271,42 +324,57 @@ class Cache:
     def flush_semantic(self) -> int:
         """Delete all semantic-cache keys. Returns count deleted."""
         if self._r_sem is None:
-            return 0
+            with self._sem_lock:
+                count = len(self._local_sem)
+                self._local_sem.clear()
+                self._sem_ids, self._sem_matrix = [], None
+            return count
         count = 0
         for key in self._r_sem.scan_iter("sem:embed:*"):
             self._r_sem.delete(key)
             count += 1
         self._r_sem.delete("sem:index")
+        self._sem_sig = None
         return count
 
     # ── Exact tier ────────────────────────────────────────────────────────
 
-    def _exact_key(self, prompt: str) -> str:
-        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
-        return f"exact:{digest}"
+    def _exact_key(self, prompt: str, system: str | None = None) -> str:
+        # Streams the parts into the hash: same digest as hashing _join(prompt, system)
+        h = hashlib.sha256()
+        if system is not None:
+            h.update(system.encode("utf-8"))
+            h.update(b"\n\n")
+        h.update(prompt.encode("utf-8"))
+        return f"exact:{h.hexdigest()}"
 
-    def _check_exact(self, prompt: str) -> str | None:
+    def _check_exact(self, prompt: str, system: str | None = None) -> str | None:
         if self._r_exact is None:
             return None
         try:
-            val = self._r_exact.get(self._exact_key(prompt))
+            val = self._r_exact.get(self._exact_key(prompt, system))
             return val  # str | None (decode_responses=True)
         except Exception as exc:
             log.debug("Exact cache get error: %s", exc)
             return None
 
-    def _store_exact(self, prompt: str, response: str) -> None:
+    def _store_exact(self, prompt: str, response: str, system: str | None = None) -> None:
         if self._r_exact is None:
             return
         try:
-            self._r_exact.setex(self._exact_key(prompt), CACHE_EXACT_TTL, response)
+            self._r_exact.setex(self._exact_key(prompt, system), CACHE_EXACT_TTL, response)
         except Exception as exc:
             log.debug("Exact cache set error: %s", exc)
 
     # ── Semantic tier ─────────────────────────────────────────────────────
 
+    def _semantic_active(self) -> bool:
+        return _EMBED_BACKEND != "none" and (self._r_sem is not None or CACHE_SEMANTIC_LOCAL)
+
     def _check_semantic(self, prompt: str) -> str | None:
-        if self._r_sem is None or _EMBED_BACKEND == "none":
+        if _EMBED_BACKEND == "none":
+            return None
+        if self._r_sem is None and not self._local_sem:
             return None
 
         query_vec = _embed(prompt)
@@ -314,26 +382,43 @@ class Cache:
             return None
 
         try:
-            # Load index: list of (entry_id, stored_prompt_hash→response)
-            index_ids: list[str] = self._r_sem.lrange("sem:index", 0, -1)
-            if not index_ids:
+            import numpy as np
+
+            expires = None
+            with self._sem_lock:
+                if self._r_sem is None:
+                    ids, matrix = self._sem_ids, self._sem_matrix
+                    expires = np.fromiter(
+                        (self._local_sem[i][1] for i in ids), dtype=np.float64, count=len(ids)
+                    )
+                else:
+                    ids, matrix = self._semantic_matrix()
+            if not ids or matrix.shape[1] != len(query_vec):
                 return None
 
-            best_sim = 0.0
-            best_entry_id: str | None = None
-
-            for entry_id in index_ids:
-                embed_raw = self._r_sem.hget(f"sem:embed:{entry_id}", "vec")
-                if embed_raw is None:
-                    continue
-                stored_vec: list[float] = json.loads(embed_raw)
-                sim = _cosine(query_vec, stored_vec)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_entry_id = entry_id
-
-            if best_sim >= CACHE_SEMANTIC_THRESHOLD and best_entry_id:
-                response = self._r_sem.hget(f"sem:embed:{best_entry_id}", "response")
+            # Stored and query vectors are L2-normalised, so one mat-vec
+            # product gives the cosine similarity against every entry
+            sims = matrix @ np.asarray(query_vec, dtype=np.float32)
+            if expires is not None:
+                # Expired local rows must not shadow a live match
+                sims[expires <= time.time()] = -np.inf
+            while True:
+                best = int(sims.argmax())
+                best_sim = float(sims[best])
+                if best_sim < CACHE_SEMANTIC_THRESHOLD:
+                    break
+                best_entry_id = ids[best]
+                if self._r_sem is None:
+                    response, _ = self._local_sem[best_entry_id]
+                else:
+                    response = self._r_sem.hget(f"sem:embed:{best_entry_id}", "response")
+                    if response is None:
+                        # Expired since the matrix was fetched: skip it, try the
+                        # next candidate, and have the next lookup rebuild
+                        sims[best] = -np.inf
+                        with self._sem_lock:
+                            self._sem_sig = None
+                        continue
                 log.debug(
                     "Semantic hit (sim=%.3f, threshold=%.3f): %.50s...",
                     best_sim, CACHE_SEMANTIC_THRESHOLD, prompt,
@@ -345,14 +430,53 @@ class Cache:
 
         return None
 
+    def _semantic_matrix(self) -> tuple[list[str], Any]:
+        """
+        Return (entry_ids, embedding matrix) for the semantic tier.
+
+        The index signature (length + newest id) is checked with one pipelined
+        round-trip; vectors are only re-fetched, also pipelined, when it changed.
+        """
+        import numpy as np
+
+        pipe = self._r_sem.pipeline()
+        pipe.llen("sem:index")
+        pipe.lindex("sem:index", -1)
+        sig = tuple(pipe.execute())
+        if sig == self._sem_sig:
+            return self._sem_ids, self._sem_matrix
+
+        index_ids: list[str] = self._r_sem.lrange("sem:index", 0, -1)
+        pipe = self._r_sem.pipeline()
+        for entry_id in index_ids:
+            pipe.hget(f"sem:embed:{entry_id}", "vec")
+
+        ids: list[str] = []
+        rows: list[Any] = []
+        for entry_id, embed_raw in zip(index_ids, pipe.execute()):
+            if embed_raw is None:  # expired
+                continue
+            ids.append(entry_id)
+            rows.append(_unpack_vec(embed_raw))
+
+        self._sem_sig = sig
+        self._sem_ids = ids
+        self._sem_matrix = np.vstack(rows) if rows else np.empty((0, 0), dtype=np.float32)
+        return self._sem_ids, self._sem_matrix
+
     def _store_semantic(self, prompt: str, response: str) -> None:
-        if self._r_sem is None or _EMBED_BACKEND == "none":
+        if _EMBED_BACKEND == "none":
             return
 
         vec = _embed(prompt)
         if vec is None:
             return
 
+        if self._r_sem is None:
+            if CACHE_SEMANTIC_LOCAL:
+                self._store_semantic_local(prompt, response, vec)
+            return
+
         try:
             # Enforce max entries (evict oldest = leftmost in index list)
             index_len = self._r_sem.llen("sem:index")
@@ -363,7 +487,7 @@ class Cache:
 
             entry_id = hashlib.sha256(f"{prompt}{time.time()}".encode()).hexdigest()[:16]
             self._r_sem.hset(f"sem:embed:{entry_id}", mapping={
-                "vec":      json.dumps(vec),
+                "vec":      _pack_vec(vec),
                 "response": response,
                 "prompt":   prompt[:200],
             })
@@ -373,6 +497,38 @@ class Cache:
         except Exception as exc:
             log.debug("Semantic cache store error: %s", exc)
 
+    def _store_semantic_local(self, prompt: str, response: str, vec: list[float]) -> None:
+        """Process-local semantic tier used when Redis is unavailable."""
+        import numpy as np
+
+        row = np.asarray(vec, dtype=np.float32)[None, :]
+        entry_id = hashlib.sha256(f"{prompt}{time.time()}".encode()).hexdigest()[:16]
+        with self._sem_lock:
+            # Build new ids/matrix rather than mutating: readers may hold the old pair
+            ids, matrix = self._sem_ids, self._sem_matrix
+            if matrix is None or not ids or matrix.shape[1] != row.shape[1]:
+                ids, matrix = [], np.empty((0, row.shape[1]), dtype=np.float32)
+                self._local_sem.clear()
+
+            # Drop expired rows, so a re-stored prompt is not shadowed by its stale twin
+            now = time.time()
+            live = [i for i, eid in enumerate(ids) if self._local_sem[eid][1] > now]
+            if len(live) < len(ids):
+                kept = {ids[i] for i in live}
+                for eid in ids:
+                    if eid not in kept:
+                        self._local_sem.pop(eid, None)
+                ids, matrix = [ids[i] for i in live], matrix[live]
+
+            # Enforce max entries (evict oldest = first row)
+            if len(ids) >= CACHE_SEMANTIC_MAX_ENTRIES:
+                self._local_sem.pop(ids[0], None)
+                ids, matrix = ids[1:], matrix[1:]
+
+            self._local_sem[entry_id] = (response, now + CACHE_SEMANTIC_TTL)
+            self._sem_ids = ids + [entry_id]
+            self._sem_matrix = np.vstack([matrix, row])
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Module-level singleton (shared across all callers in the process)
@@ -389,27 +545,37 @@ def get_cache() -> Cache:
     return _cache_instance
 
 
+def blocking() -> bool:
+    """
+    True if check()/store() may block: the singleton is not built yet (its
+    constructor pings Redis), or a Redis tier or the embedder is in play.
+    When False both are pure in-memory calls, safe to run on an event loop.
+    """
+    c = _cache_instance
+    return c is None or c._r_exact is not None or c._semantic_active()
+
+
 # ── Convenience wrappers ──────────────────────────────────────────────────────
 
-def check(prompt: str) -> str | None:
-    """Module-level shortcut: get_cache().check(prompt)."""
-    return get_cache().check(prompt)
+def check(prompt: str, system: str | None = None) -> str | None:
+    """Module-level shortcut: get_cache().check(prompt, system)."""
+    return get_cache().check(prompt, system)
 
 
-def get(prompt: str, thresh: float = 0.95) -> str | None:
+def get(prompt: str, thresh: float = 0.95, system: str | None = None) -> str | None:
     """PRD compliant alias for check()."""
     # Note: Threshold override logic could be added to Cache.check if needed.
-    return get_cache().check(prompt)
+    return get_cache().check(prompt, system)
 
 
-def store(prompt: str, response: str) -> None:
-    """Module-level shortcut: get_cache().store(prompt, response)."""
-    get_cache().store(prompt, response)
+def store(prompt: str, response: str, system: str | None = None) -> None:
+    """Module-level shortcut: get_cache().store(prompt, response, system)."""
+    get_cache().store(prompt, response, system)
 
 
-def set(prompt: str, response: str) -> None:
+def set(prompt: str, response: str, system: str | None = None) -> None:
     """PRD compliant alias for store()."""
-    get_cache().store(prompt, response)
+    get_cache().store(prompt, response, system)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
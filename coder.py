@@ -9,7 +9,6 @@ to disk, execute them, and return the output.
 
 import asyncio
 import logging
-import re
 import shlex
 import subprocess
 from pathlib import Path
@@ -57,11 +56,19 @@ async def generate_and_save_code(prompt: str, filename: str = "generated_script.
     return script_path
 
 def _extract_code(text: str) -> str:
-    """Extract code from generic markdown blocks."""
-    match = re.search(r"```(?:python)?\s*(.*?)\s*```", text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+    """Extract code from the first markdown block, whatever its language tag."""
+    start = text.find("```")
+    if start == -1:
+        return ""
+    body_start = start + 3
+    end = text.find("```", body_start)
+    if end == -1:
+        return ""
+    # Skip the rest of the opening fence line (```python, ```py, ```Python3 ...)
+    nl = text.find("\n", body_start, end)
+    if nl != -1:
+        body_start = nl + 1
+    return text[body_start:end].strip()
 
 async def execute_script(script_path: Path, timeout: int = 30) -> Tuple[bool, str]:
     """Execute a Python script and capture its output."""
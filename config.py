@@ -7,8 +7,11 @@ Every module that previously defined its own ROOT / DATA_DIR / LOG_DIR /
 JOBS_DB / TOKEN_LOG_DB / SKILLS_DIR should import from here instead.
 """
 
+import os
 from pathlib import Path
 
+from dotenv import load_dotenv
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 ROOT = Path(__file__).parent.resolve()
 DATA_DIR = ROOT / "data"
@@ -16,10 +19,17 @@ LOG_DIR = ROOT / "logs"
 SKILLS_DIR = ROOT / "skills"
 WORKSPACE_DIR = DATA_DIR / "workspace"
 
+ENV_FILE = ROOT / ".env"
+
 JOBS_DB = DATA_DIR / "jobs.db"
 TOKEN_LOG_DB = DATA_DIR / "token_log.db"
 
 # ── Ensure directories exist on first import ──────────────────────────────────
-DATA_DIR.mkdir(exist_ok=True)
-LOG_DIR.mkdir(exist_ok=True)
-WORKSPACE_DIR.mkdir(exist_ok=True)
+# One makedirs per leaf: WORKSPACE_DIR brings DATA_DIR with it
+for _leaf in (WORKSPACE_DIR, LOG_DIR):
+    os.makedirs(_leaf, exist_ok=True)
+
+# ── Environment ───────────────────────────────────────────────────────────────
+# Parsed once per process, from a fixed path (no find_dotenv() stack walk);
+# importing config is what makes .env values visible to os.getenv()
+load_dotenv(ENV_FILE)
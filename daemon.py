@@ -23,7 +23,6 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from dotenv import load_dotenv
 
 import tg_bot as tg_module
 from tg_bot import Notifier, register_enqueue, register_status, register_orchestrate
@@ -34,8 +33,6 @@ import monitor
 import data
 import vuln_prioritize
 
-load_dotenv()
-
 # ── Null Notifier (for testing) ────────────────────────────────────────────────
 class NullNotifier:
     async def send(self, text: str, parse_mode: str = "Markdown"): pass
@@ -57,9 +54,22 @@ logging.basicConfig(
 )
 log = logging.getLogger("hexclaw.daemon")
 
+# Awesome-skill instructions are pasted into the coder prompt; cap them by
+# UTF-8 bytes so one oversized SKILL.md cannot blow the context window
+SKILL_PROMPT_MAX_BYTES: int = int(os.getenv("SKILL_PROMPT_MAX_BYTES", "20000"))
+
 # ── Database ──────────────────────────────────────────────────────────────────
-def init_db():
+def _connect() -> sqlite3.Connection:
+    # jobs.db is in WAL mode (set once by init_db); NORMAL then only fsyncs at
+    # checkpoints instead of on every status update, and stays crash-consistent
     conn = sqlite3.connect(JOBS_DB)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def init_db():
+    conn = _connect()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("BEGIN")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
             id TEXT PRIMARY KEY,
@@ -74,6 +84,9 @@ def init_db():
             error TEXT
         )
     """)
+    # Heartbeat polls by status; /status lists newest first
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at)")
     conn.commit()
     conn.close()
 
@@ -90,7 +103,7 @@ class JobStatus:
 async def enqueue_job(skill: str, params: dict) -> str:
     job_id = str(uuid.uuid4())[:8]
     target = params.get("target", "unknown")
-    conn = sqlite3.connect(JOBS_DB)
+    conn = _connect()
     conn.execute(
         "INSERT INTO jobs (id, skill, params, target, created_at) VALUES (?, ?, ?, ?, ?)",
         (job_id, skill, json.dumps(params), target, datetime.now(timezone.utc).isoformat())
@@ -101,21 +114,21 @@ async def enqueue_job(skill: str, params: dict) -> str:
     return job_id
 
 def get_pending_jobs():
-    conn = sqlite3.connect(JOBS_DB)
+    conn = _connect()
     conn.row_factory = sqlite3.Row
     jobs = conn.execute("SELECT * FROM jobs WHERE status = ?", (JobStatus.PENDING,)).fetchall()
     conn.close()
     return jobs
 
 def get_recent_jobs(limit=10):
-    conn = sqlite3.connect(JOBS_DB)
+    conn = _connect()
     conn.row_factory = sqlite3.Row
     jobs = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
     conn.close()
     return [dict(j) for j in jobs]
 
 def update_job_status(job_id: str, status: str, result: Any = None, error: str = None):
-    conn = sqlite3.connect(JOBS_DB)
+    conn = _connect()
     now = datetime.now(timezone.utc).isoformat()
     if status == JobStatus.RUNNING:
         conn.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?", (status, now, job_id))
@@ -128,6 +141,21 @@ def update_job_status(job_id: str, status: str, result: Any = None, error: str =
     conn.close()
 
 # ── Skills & MCP ──────────────────────────────────────────────────────────────
+def _pack_within_budget(text: str, max_bytes: int = SKILL_PROMPT_MAX_BYTES) -> str:
+    """Leading whole paragraphs of *text* that fit in *max_bytes* UTF-8 bytes."""
+    out, size = [], 0
+    for para in text.split("\n\n"):
+        n = len(para.encode()) + 2
+        if size + n > max_bytes:
+            break
+        out.append(para)
+        size += n
+    if len(out) < text.count("\n\n") + 1:
+        log.info(f"Skill instructions trimmed to {size} of {len(text.encode())} bytes")
+        if not out:
+            return text.encode()[:max_bytes].decode(errors="ignore")
+    return "\n\n".join(out)
+
 async def run_skill(job_id: str, skill_name: str, params: dict, notifier: Notifier | NullNotifier):
     target = params.get("target", "unknown")
     log.info(f"[Job {job_id}] Skill dispatch: {skill_name} → {target}")
@@ -174,7 +202,7 @@ async def run_skill(job_id: str, skill_name: str, params: dict, notifier: Notifi
         if action == "execute_awesome_skill":
             goal = step_params.get("goal", "No goal provided")
             skill_n = step_params.get("skill_name", "unknown_skill")
-            content = step_params.get("skill_content", "")
+            content = _pack_within_budget(step_params.get("skill_content", ""))
             
             log.info(f"[Job {job_id}] Executing Awesome Skill: {skill_n} for goal: {goal}")
             await notifier.send(f"🌟 Executing Awesome Skill: *{skill_n}*\nGoal: {goal}")
@@ -209,16 +237,19 @@ async def run_skill(job_id: str, skill_name: str, params: dict, notifier: Notifi
                     {"target": context.get("target"), "severity": "medium", "name": "XSS", "template_id": "xss-generic"}
                 ]
             df = pd.DataFrame(context["findings"])
-            data.store_parquet(df, f"job_{job_id}")
+            data.store_parquet(df, f"{data.FINDINGS_PREFIX}{job_id}")
             log.info(f"[Job {job_id}] Stored {len(context['findings'])} findings to parquet")
             await notifier.send(f"💾 Job {job_id}: {len(context['findings'])} findings stored.")
             continue
 
         if action == "suggest_next":
             log.info(f"[Job {job_id}] Generating next-step suggestions for {skill_name}")
-            suggestions = data.suggest_next(skill_name)
-            # Prioritize vulnerabilities for the notification
-            top_vulns = vuln_prioritize.get_top_cves(f"job_{job_id}")
+            # Suggestions and vulnerability ranking both scan Parquet — run them
+            # side by side on worker threads instead of serially on the loop
+            suggestions, top_vulns = await asyncio.gather(
+                data.asuggest_next(skill_name),
+                asyncio.to_thread(vuln_prioritize.get_top_cves, f"job_{job_id}"),
+            )
             log.info(f"[Job {job_id}] Suggestions: {suggestions} | Top CVEs: {top_vulns[:80]}")
             
             prompt = f"🎯 *Recon Complete for {context.get('target', 'Target')}*\n\n{top_vulns}\n\nWhat would you like to do next?"
@@ -267,6 +298,7 @@ class HexClawDaemon:
 
     async def start(self):
         init_db()
+        data.warm_cache()
         header_text = "HexClaw Daemon v1.0 Starting"
         log.info(header_text)
         
@@ -8,21 +8,38 @@ PRD compliance:
   • psycopg2 for persistence/heavy lookups in Postgres.
   • query(prompt): text-to-sql -> DataFrame.
   • store_parquet(df, name): save results for persistence.
-  • suggest_next(workflow_id): Internal logic to pick next actions based on data.
+  • compact(name): fold appended part-files back into one Parquet.
+  • global_stats(): severity roll-up across all findings, cached on disk.
+  • suggest_next(workflow_id): Internal logic to pick next actions based on data
+    (asuggest_next for async callers).
 """
 
+import asyncio
+import functools
 import logging
 import os
+import re
 import sqlite3
+import string
+import threading
+import uuid
 from typing import Any, List, Optional
 
 import duckdb
 import pandas as pd
-from dotenv import load_dotenv
 
-import inference
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import ahocorasick  # pyahocorasick — optional, speeds up intent matching
+except ImportError:
+    ahocorasick = None
 
-load_dotenv()
+import inference
 
 log = logging.getLogger("hexclaw.data")
 
@@ -31,67 +48,363 @@ from config import DATA_DIR, JOBS_DB
 
 # ── Engines ───────────────────────────────────────────────────────────────────
 _duck = duckdb.connect(':memory:')
+# Reuse Parquet footers/metadata across queries on the same files
+_duck.execute("PRAGMA enable_object_cache")
+# Multi-file scans (compact, global_stats) fan out across all cores
+_duck.execute("SET threads TO ?", [os.cpu_count() or 4])
+
+# Rows per Parquet row group on every write — keeps min/max stats useful for pruning
+_ROW_GROUP_SIZE = 100_000
+# Findings datasets are named f"{FINDINGS_PREFIX}{job_id}" (see daemon.py)
+FINDINGS_PREFIX = "job_"
 
 def get_duck():
+    """Shared DuckDB connection; take .cursor() per call when off the main thread."""
     return _duck
 
 def get_pg_conn():
-    """Return a psycopg2 connection if POSTGRES_DSN is set."""
+    """
+    Return a psycopg2 connection if POSTGRES_DSN is set.
+    Cursors default to RealDictCursor, so fetches yield dicts built by the
+    driver — no dict(zip(cols, row)) pass needed on the caller side.
+    The connection is in autocommit mode: lookups don't open an implicit
+    transaction that sits idle until someone remembers to commit.
+    """
     dsn = os.getenv("POSTGRES_DSN")
     if not dsn:
         return None
     try:
         import psycopg2
-        return psycopg2.connect(dsn)
+        from psycopg2.extras import RealDictCursor
+        conn = psycopg2.connect(dsn, cursor_factory=RealDictCursor)
+        conn.autocommit = True
+        return conn
     except Exception as e:
         log.warning(f"Postgres connection failed: {e}")
         return None
 
+# ── Text-to-SQL rules ─────────────────────────────────────────────────────────
+# Canned SQL for common questions (keyed by normalised question) — 0 tokens
+_PREBUILT_SQL = {
+    "show me the last 5 jobs and their status":
+        "SELECT id, skill, target, status, created_at FROM jobs ORDER BY created_at DESC LIMIT 5",
+    "job status summary":
+        "SELECT status, COUNT(*) AS jobs FROM jobs GROUP BY status ORDER BY jobs DESC",
+    "failed jobs":
+        "SELECT id, skill, target, error, finished_at FROM jobs WHERE status = 'failed' ORDER BY finished_at DESC",
+    "running jobs":
+        "SELECT id, skill, target, started_at FROM jobs WHERE status = 'running' ORDER BY started_at",
+}
+
+# Pure-count questions about findings: key -> severity filter (None = all).
+# Answered from Parquet footers / the stats roll-up, never a row scan or LLM.
+_COUNT_INTENTS: dict[str, Optional[str]] = {
+    f"{prefix} {sev + ' ' if sev else ''}{noun}": sev
+    for prefix in ("how many", "count")
+    for sev in (None, "critical", "high", "medium", "low", "info")
+    for noun in ("findings", "vulns", "vulnerabilities")
+}
+
+# ASCII punctuation/control chars map to a space; letters are lowered beforehand
+_KEEP = frozenset(string.ascii_lowercase + string.digits + " ")
+_TRANS = str.maketrans({c: " " for c in map(chr, range(128)) if c not in _KEEP})
+
+# Leading ```/```sql and trailing ``` fences around LLM-generated SQL
+_SQL_FENCE_RE = re.compile(r"^\s*```(?:sql)?\s*|\s*```\s*$", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=4096)
+def _normalise_question(q: str) -> str:
+    """Lowercase, drop ASCII punctuation and collapse whitespace."""
+    return " ".join(q.lower().translate(_TRANS).split())
+
+def _build_prebuilt_matcher():
+    """Aho-Corasick automaton over the space-padded prebuilt keys, or None."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key, sql in _PREBUILT_SQL.items():
+        automaton.add_word(f" {key} ", (key, sql))
+    automaton.make_automaton()
+    return automaton
+
+_PREBUILT_AC = _build_prebuilt_matcher()
+# Longest first, so the fallback scan also prefers the most specific intent
+_PREBUILT_KEYS = sorted(_PREBUILT_SQL, key=len, reverse=True)
+
+@functools.lru_cache(maxsize=4096)
+def _match_prebuilt(norm: str) -> Optional[tuple[str, str]]:
+    """
+    Return (key, sql) for the longest prebuilt key contained in *norm* as
+    whole words (e.g. "please list failed jobs" -> "failed jobs"), or None.
+    One automaton pass when pyahocorasick is installed, else a substring scan.
+    Memoised — call _match_prebuilt.cache_clear() if _PREBUILT_SQL changes.
+    """
+    if (sql := _PREBUILT_SQL.get(norm)) is not None:
+        return norm, sql
+    padded = f" {norm} "
+    if _PREBUILT_AC is not None:
+        return max((hit for _, hit in _PREBUILT_AC.iter(padded)), key=lambda hit: len(hit[0]), default=None)
+    key = next((key for key in _PREBUILT_KEYS if f" {key} " in padded), None)
+    return (key, _PREBUILT_SQL[key]) if key else None
+
+# Materialised prebuilt results: key -> (_jobs_version() when run, DataFrame).
+# Served until jobs.db changes on disk.
+_prebuilt_cache: dict[str, tuple[tuple, pd.DataFrame]] = {}
+
+# Rows returned by query(); /data replies are capped far below this anyway
+QUERY_MAX_ROWS: int = int(os.getenv("QUERY_MAX_ROWS", "50"))
+_jobs_attached = False
+_attach_lock = threading.Lock()
+
+def _jobs_version() -> tuple:
+    """
+    (mtime_ns, size) of jobs.db and its WAL. In WAL mode commits land in
+    jobs.db-wal while any connection is open, leaving the main file untouched
+    until a checkpoint, so both files are needed to notice a change.
+    """
+    version = []
+    for path in (JOBS_DB, JOBS_DB.with_name(JOBS_DB.name + "-wal")):
+        try:
+            st = path.stat()
+            version.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            version.append(None)
+    return tuple(version)
+
+def _attach_jobs():
+    """Attach the SQLite jobs DB to the shared DuckDB session (once per process)."""
+    global _jobs_attached
+    with _attach_lock:
+        if _jobs_attached:
+            return
+        _duck.execute("INSTALL sqlite; LOAD sqlite;")
+        # ATTACH takes no bind parameters, so escape the path literal by hand
+        jobs_db = str(JOBS_DB).replace("'", "''")
+        _duck.execute(f"ATTACH IF NOT EXISTS '{jobs_db}' AS main_jobs (TYPE SQLITE)")
+        # Set search path so 'jobs' works without 'main_jobs.' prefix
+        _duck.execute("SET search_path = 'main_jobs,main'")
+        _jobs_attached = True
+
+def _run_sql(sql: str, limit: Optional[int] = None) -> pd.DataFrame:
+    """
+    Execute *sql* on a private cursor of the shared DuckDB instance.
+    Safe to call from a worker thread; the attached jobs DB is shared but
+    search_path is per-cursor, so it is set again here.
+
+    *limit* is pushed into the plan as a LIMIT, so DuckDB stops producing rows
+    early instead of materialising the full result in pandas.
+    """
+    _attach_jobs()
+    cur = _duck.cursor()
+    try:
+        cur.execute("SET search_path = 'main_jobs,main'")
+        rel = cur.sql(sql)
+        if rel is None:  # statement without a result set
+            return pd.DataFrame()
+        return (rel.limit(limit) if limit else rel).df()
+    finally:
+        cur.close()
+
+def warm_cache() -> int:
+    """
+    Run every prebuilt query once in the shared DuckDB session and keep the
+    results, so the first matching question skips both LLM and SQL.
+    Returns the number of queries materialised.
+    """
+    try:
+        _attach_jobs()
+    except Exception as e:
+        log.warning(f"Prebuilt cache warm-up skipped: {e}")
+        return 0
+    version = _jobs_version()
+    for key, sql in _PREBUILT_SQL.items():
+        try:
+            _prebuilt_cache[key] = (version, _duck.execute(sql).df())
+        except Exception as e:
+            log.debug(f"Prebuilt warm-up failed for '{key}': {e}")
+    return len(_prebuilt_cache)
+
 # ── Analytics ─────────────────────────────────────────────────────────────────
-async def query(prompt: str) -> pd.DataFrame:
+async def query(prompt: str, limit: Optional[int] = QUERY_MAX_ROWS) -> pd.DataFrame:
     """
     Translate natural language to SQL and run against DuckDB.
     In v1.0, this is a 'Thrifty' shim using LLM only for SQL generation.
+    At most *limit* rows are returned (None for all).
     """
     # 1. Get Schema (simplified for v1.0)
     schema = "Tables: jobs(id, skill, target, status), token_log(provider, model, cost)" 
     
-    # 2. Text-to-SQL or Direct SQL
+    # 2. Direct SQL, prebuilt rule, or Text-to-SQL
+    key = None
     if any(keyword in prompt.upper() for keyword in ["SELECT ", "WITH ", "DESCRIBE "]):
         sql = prompt
+    elif (key := _normalise_question(prompt)) in _COUNT_INTENTS:
+        log.info("Count intent — answered from Parquet metadata, 0 tokens")
+        count = await asyncio.to_thread(count_findings, _COUNT_INTENTS[key])
+        return pd.DataFrame({"findings": [count]})
+    elif (match := _match_prebuilt(key)) is not None:
+        key, sql = match
+        log.info(f"Prebuilt SQL match '{key}' — 0 tokens")
+        cached = _prebuilt_cache.get(key)
+        if cached and cached[0] == _jobs_version():
+            return cached[1].head(limit).copy() if limit else cached[1].copy()
     else:
         sql_prompt = f"Convert this request to a DuckDB SQL query. Only respond with the SQL.\nSchema: {schema}\nRequest: {prompt}"
         sql = await inference.ask(sql_prompt, complexity="med", system="You are a SQL expert. Output ONLY valid DuckDB SQL.")
     
     # Clean SQL if LLM included backticks or returned an error message
-    sql = sql.replace("```sql", "").replace("```", "").strip()
+    sql = _SQL_FENCE_RE.sub("", sql).strip()
     if sql.startswith("Error:"):
         log.error(f"LLM returned error instead of SQL: {sql}")
         return pd.DataFrame()
     
     log.info(f"Executing SQL: {sql}")
     
-    # 3. Execute
+    # 3. Execute off the event loop so concurrent queries don't block the daemon
     try:
-        # JOBS_DB imported from config at module level
-        _duck.execute("INSTALL sqlite; LOAD sqlite;")
-        _duck.execute(f"ATTACH IF NOT EXISTS '{JOBS_DB}' AS main_jobs (TYPE SQLITE)")
-        
-        # Set search path so 'jobs' works without 'main_jobs.' prefix
-        _duck.execute("SET search_path = 'main_jobs,main'")
-        
-        df = _duck.query(sql).to_df()
-        return df
+        version = _jobs_version()
+        if key in _PREBUILT_SQL:
+            # Cache the full result so any later limit can be served from it
+            df = await asyncio.to_thread(_run_sql, sql)
+            _prebuilt_cache[key] = (version, df.copy())
+            return df.head(limit) if limit else df
+        return await asyncio.to_thread(_run_sql, sql, limit)
     except Exception as e:
         log.error(f"Data query failed: {e}")
         return pd.DataFrame()
 
-def store_parquet(df: pd.DataFrame, name: str):
-    """Store results as Parquet in the data directory."""
+def parquet_files(name: str) -> List[str]:
+    """Return the base Parquet file for *name* plus any appended part-files."""
+    base = DATA_DIR / f"{name}.parquet"
+    files = [base] if base.exists() else []
+    files.extend(sorted(DATA_DIR.glob(f"{name}.part-*.parquet")))
+    return [str(p) for p in files]
+
+def store_parquet(df: pd.DataFrame, name: str, mode: str = "overwrite"):
+    """
+    Store results as Parquet in the data directory.
+
+    mode="append" writes a new part-file next to the existing data instead of
+    rewriting it, so each append costs O(new rows). Readers should go through
+    parquet_files(name); compact(name) folds the parts back into one file.
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to store Parquet results (pip install pyarrow)")
     path = DATA_DIR / f"{name}.parquet"
-    df.to_parquet(path)
+    if mode == "append":
+        if path.exists():
+            path = DATA_DIR / f"{name}.part-{uuid.uuid4().hex[:8]}.parquet"
+    else:
+        # Overwrite replaces the whole dataset, including earlier appends
+        for part in DATA_DIR.glob(f"{name}.part-*.parquet"):
+            part.unlink(missing_ok=True)
+    # Bounded row groups with column statistics let DuckDB skip row groups on
+    # WHERE filters and decode only the selected columns
+    df.to_parquet(path, engine="pyarrow", row_group_size=_ROW_GROUP_SIZE, write_statistics=True)
+    _rollup_path().unlink(missing_ok=True)
     log.info(f"Stored {len(df)} rows to {path}")
 
+def compact(name: str) -> int:
+    """
+    Merge the base file and all part-files for *name* into a single Parquet.
+    Returns the number of part-files folded in (0 if nothing to do).
+    """
+    files = parquet_files(name)
+    if len(files) < 2:
+        return 0
+    path = DATA_DIR / f"{name}.parquet"
+    tmp = DATA_DIR / f"{name}.compacting"
+    try:
+        # One parallel scan over the whole file list. COPY ... TO cannot bind
+        # its target, so write through the relation API.
+        _duck.sql("SELECT * FROM read_parquet(?, union_by_name=true)", params=[files]).write_parquet(
+            str(tmp), row_group_size=_ROW_GROUP_SIZE
+        )
+        tmp.replace(path)
+    except Exception as e:
+        log.error(f"Compaction of {name} failed: {e}")
+        tmp.unlink(missing_ok=True)
+        return 0
+    parts = [p for p in files if p != str(path)]
+    for part in parts:
+        os.remove(part)
+    _rollup_path().unlink(missing_ok=True)
+    log.info(f"Compacted {len(parts)} part-files into {path}")
+    return len(parts)
+
+def _rollup_path():
+    return DATA_DIR / "_rollup" / "stats.parquet"
+
+def _findings_files() -> List[str]:
+    """
+    Every findings Parquet (base and part-files). The daemon stores each job's
+    findings as job_<id>; other datasets in DATA_DIR are not findings.
+    """
+    return [str(p) for p in sorted(DATA_DIR.glob(f"{FINDINGS_PREFIX}*.parquet"))]
+
+def global_stats(cached: bool = True) -> dict:
+    """
+    Severity counts across every findings Parquet (job_*) in the data directory.
+
+    The result is materialised to data/_rollup/stats.parquet and served from
+    there while no source Parquet is newer than the roll-up, so repeated bot
+    commands do not rescan every findings file.
+    Returns {"total": int, "by_severity": {severity: count}}.
+    """
+    sources = _findings_files()
+    if not sources:
+        return {"total": 0, "by_severity": {}}
+
+    # Aggregates stay inside DuckDB: the GROUP BY decodes only the severity
+    # column, and rows come back as plain tuples (no pandas round-trip)
+    # A private cursor keeps this safe to run from worker threads (asuggest_next)
+    rollup = _rollup_path()
+    try:
+        with _duck.cursor() as cur:
+            if cached and rollup.exists() and rollup.stat().st_mtime >= max(os.path.getmtime(p) for p in sources):
+                rows = cur.execute("SELECT severity, findings FROM read_parquet(?)", [str(rollup)]).fetchall()
+            else:
+                rows = cur.execute(
+                    "SELECT severity, COUNT(*) AS findings FROM read_parquet(?, union_by_name=true) GROUP BY severity",
+                    [sources],
+                ).fetchall()
+                rollup.parent.mkdir(exist_ok=True)
+                # Write aside and swap in, so concurrent readers never see a partial file
+                tmp = rollup.with_name(f"stats.{uuid.uuid4().hex[:8]}.writing")
+                try:
+                    cur.sql(
+                        "SELECT unnest(?::VARCHAR[]) AS severity, unnest(?::BIGINT[]) AS findings",
+                        params=[[r[0] for r in rows], [r[1] for r in rows]],
+                    ).write_parquet(str(tmp))
+                    tmp.replace(rollup)
+                finally:
+                    tmp.unlink(missing_ok=True)
+    except Exception as e:
+        log.warning(f"global_stats failed: {e}")
+        return {"total": 0, "by_severity": {}}
+
+    by_severity = {sev: int(n) for sev, n in rows}
+    return {"total": sum(by_severity.values()), "by_severity": by_severity}
+
+def count_findings(severity: Optional[str] = None) -> int:
+    """
+    Number of stored findings, optionally for a single severity.
+    Unfiltered counts are summed from Parquet footers (O(files), no row scan);
+    filtered counts come from the global_stats() roll-up.
+    """
+    if severity:
+        return int(global_stats()["by_severity"].get(severity, 0))
+    sources = _findings_files()
+    if not sources:
+        return 0
+    try:
+        with _duck.cursor() as cur:
+            row = cur.execute("SELECT COALESCE(SUM(num_rows), 0) FROM parquet_file_metadata(?)", [sources]).fetchone()
+        return int(row[0])
+    except Exception as e:
+        log.warning(f"count_findings failed: {e}")
+        return 0
+
 # ── Workflows ─────────────────────────────────────────────────────────────────
 def suggest_next(workflow_id: str) -> List[str]:
     """
@@ -106,16 +419,17 @@ def suggest_next(workflow_id: str) -> List[str]:
     # Simulating data-driven logic
     suggestions = ["Deep scan target", "Identify tech stack"]
     
-    # Logic: if ports table exists and has entries for this workflow
-    try:
-        res = _duck.query(f"SELECT COUNT(*) FROM read_parquet('{DATA_DIR}/*.parquet') WHERE severity = 'high'").fetchone()
-        if res and res[0] > 0:
-            suggestions.insert(0, "Exploit CVE")
-    except:
-        pass
+    # Logic: any critical/high findings on disk (served from the stats roll-up)
+    by_severity = global_stats()["by_severity"]
+    if by_severity.get("critical", 0) + by_severity.get("high", 0) > 0:
+        suggestions.insert(0, "Exploit CVE")
         
     return suggestions[:4]
 
+async def asuggest_next(workflow_id: str) -> List[str]:
+    """suggest_next() on a worker thread, so the stats scan never blocks the event loop."""
+    return await asyncio.to_thread(suggest_next, workflow_id)
+
 # ── Telegram Integration ─────────────────────────────────────────────────────
 async def get_summary_df() -> str:
     """Returns a markdown summary of the last 5 jobs for Telegram."""
@@ -123,3 +437,29 @@ async def get_summary_df() -> str:
     if df.empty:
         return "No job data available."
     return df.to_markdown(index=False)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HexClaw data — natural-language / SQL queries over the data dir")
+    parser.add_argument("question", nargs="*", help="Question or SQL to run")
+    parser.add_argument("--batch", metavar="FILE", help="Run every non-empty line of FILE concurrently")
+    parser.add_argument("--limit", type=int, default=QUERY_MAX_ROWS, help=f"Max rows per answer (default: {QUERY_MAX_ROWS})")
+    args = parser.parse_args()
+
+    questions = [" ".join(args.question)] if args.question else []
+    if args.batch:
+        with open(args.batch, encoding="utf-8") as fh:
+            questions += [line.strip() for line in fh if line.strip()]
+    if not questions:
+        parser.error("give a question or --batch FILE")
+
+    async def _answer_all():
+        return await asyncio.gather(*(query(q, limit=args.limit) for q in questions))
+
+    # One loop for the whole run, so LLM clients and worker threads are reused
+    with asyncio.Runner() as runner:
+        results = runner.run(_answer_all())
+    for q, df in zip(questions, results):
+        print(f"\n> {q}")
+        print(df.to_string(index=False) if not df.empty else "(no rows)")
@@ -6,7 +6,7 @@ Gmail API module using google-api-python-client.
 
 import os
 import logging
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 try:
     from googleapiclient.discovery import build
@@ -16,6 +16,9 @@ except ImportError:
 
 log = logging.getLogger("hexclaw.email.gmail")
 
+# Gmail accepts up to 100 calls per batch but throttles above ~50
+BATCH_SIZE = 50
+
 class GmailEngine:
     def __init__(self):
         self.service = None
@@ -35,6 +38,30 @@ class GmailEngine:
         if not self.service: return {}
         return self.service.users().messages().get(userId='me', id=msg_id).execute()
 
+    def get_messages(self, msg_ids: Iterable[str]) -> Dict[str, dict]:
+        """
+        Fetch many messages with batch HTTP requests (BATCH_SIZE per round-trip)
+        instead of one get_message() call each. Returns {msg_id: message};
+        ids that fail are logged and left out.
+        """
+        if not self.service: return {}
+        ids = list(dict.fromkeys(msg_ids))
+        results: Dict[str, dict] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                log.warning(f"Gmail get {request_id} failed: {exception}")
+            else:
+                results[request_id] = response
+
+        messages = self.service.users().messages()
+        for i in range(0, len(ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for msg_id in ids[i:i + BATCH_SIZE]:
+                batch.add(messages.get(userId='me', id=msg_id), request_id=msg_id)
+            batch.execute()
+        return results
+
     def create_draft(self, raw_message: str) -> str:
         """Create a draft from base64 encoded RFC822 message."""
         if not self.service: return ""
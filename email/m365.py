@@ -52,14 +52,19 @@ class M365Engine:
             self.client = GraphServiceClient(email, pw)
 
     def classify_and_label(self, domain: str):
-        """Classify emails from a specific domain."""
+        """
+        Classify emails from a specific domain (or its subdomains).
+        Matches on the sender's address suffix, so "evil-target.com" or
+        "target.com.attacker.com" do not count as "target.com".
+        """
         if not self.client: return []
-        messages = self.client.list_messages()
-        results = []
-        for msg in messages:
-            if domain in msg.get("sender", ""):
-                results.append({"id": msg["id"], "label": "phishing_target"})
-        return results
+        domain = domain.lower().lstrip("@")
+        suffixes = (f"@{domain}", f".{domain}")
+        return [
+            {"id": msg["id"], "label": "phishing_target"}
+            for msg in self.client.list_messages()
+            if msg.get("sender", "").lower().rstrip(">").endswith(suffixes)
+        ]
 
     def draft_reply(self, msg_id: str, content: str):
         """Draft a reply string."""
@@ -94,6 +94,28 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
 
+# Tool responses carry full stdout/stderr, often tens of KB per request, so
+# JSON encoding is real CPU work; use orjson for it when installed
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """orjson-backed JSON provider; falls back to the stdlib encoder for values orjson rejects"""
+
+        def dumps(self, obj, **kwargs):
+            try:
+                return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except orjson.JSONEncodeError:
+                return super().dumps(obj, **kwargs)
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+except ImportError:
+    pass
+
 # API Configuration
 API_PORT = int(os.environ.get('HEXSTRIKE_PORT', 8888))
 API_HOST = os.environ.get('HEXSTRIKE_HOST', '127.0.0.1')
@@ -1177,12 +1199,13 @@ class IntelligentDecisionEngine:
         """Optimize Hydra parameters"""
         params = {"target": profile.target}
 
-        # Determine service based on open ports
-        if 22 in profile.open_ports:
+        # Determine service based on open ports (one set build, O(1) checks)
+        open_ports = set(profile.open_ports)
+        if 22 in open_ports:
             params["service"] = "ssh"
-        elif 21 in profile.open_ports:
+        elif 21 in open_ports:
             params["service"] = "ftp"
-        elif 80 in profile.open_ports or 443 in profile.open_ports:
+        elif open_ports & {80, 443}:
             params["service"] = "http-get"
         else:
             params["service"] = "ssh"  # Default
@@ -4335,13 +4358,12 @@ class TechnologyDetector:
                             if tech not in detected[category]:
                                 detected[category].append(tech)
 
-        # Port-based service detection
+        # Port-based service detection (distinct ports only, input order kept)
         if ports:
-            for port in ports:
-                if port in self.port_services:
-                    service = self.port_services[port]
-                    if service not in detected["services"]:
-                        detected["services"].append(service)
+            for port in dict.fromkeys(ports):
+                service = self.port_services.get(port)
+                if service and service not in detected["services"]:
+                    detected["services"].append(service)
 
         return detected
 
@@ -9127,6 +9149,23 @@ file_manager = FileOperationsManager()
 
 # API Routes
 
+# Tool presence per binary name, refreshed every CACHE_TTL seconds: one PATH
+# scan per tool instead of a `which` subprocess per tool on every /health
+_tool_presence: Dict[str, bool] = {}
+_tool_presence_at = 0.0
+
+def tool_available(tool: str) -> bool:
+    """Whether *tool* is on PATH (cached shutil.which lookup)"""
+    global _tool_presence_at
+    now = time.time()
+    if now - _tool_presence_at > CACHE_TTL:
+        _tool_presence.clear()
+        _tool_presence_at = now
+    found = _tool_presence.get(tool)
+    if found is None:
+        found = _tool_presence[tool] = shutil.which(tool) is not None
+    return found
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint with comprehensive tool detection"""
@@ -9203,11 +9242,7 @@ def health_check():
     tools_status = {}
 
     for tool in all_tools:
-        try:
-            result = execute_command(f"which {tool}", use_cache=True)
-            tools_status[tool] = result["success"]
-        except:
-            tools_status[tool] = False
+        tools_status[tool] = tool_available(tool)
 
     all_essential_tools_available = all(tools_status[tool] for tool in essential_tools)
 
@@ -10570,9 +10605,9 @@ def get_httpx_binary() -> str:
     if _HTTPX_BINARY:
         return _HTTPX_BINARY
     
-    if shutil.which("httpx"):
+    if tool_available("httpx"):
         _HTTPX_BINARY = "httpx"
-    elif shutil.which("httpx-toolkit"):
+    elif tool_available("httpx-toolkit"):
         _HTTPX_BINARY = "httpx-toolkit"
     else:
         # Fallback to httpx if neither is found
@@ -12597,10 +12632,16 @@ def us_masscan_vuln():
         if unconfirmed_ips:
             top_findings.append(f"{len(unconfirmed_ips)} hosts with port open but service unconfirmed (may need manual verification)")
 
-        # Insight aggregation — group similar titles and count occurrences
-        title_counter = Counter(i.get("title", "") for i in all_insights)
+        # Insight aggregation — group similar titles and count occurrences,
+        # keeping each title's first severity in the same pass
+        title_counter = Counter()
+        title_severity = {}
+        for insight in all_insights:
+            title = insight.get("title", "")
+            title_counter[title] += 1
+            title_severity.setdefault(title, insight.get("severity", "info"))
         aggregated_insights = [
-            {"title": title, "count": count, "severity": next((i["severity"] for i in all_insights if i.get("title") == title), "info")}
+            {"title": title, "count": count, "severity": title_severity[title]}
             for title, count in title_counter.most_common(15)
         ]
 
@@ -6,27 +6,31 @@ Thrifty LLM inference with provider tiering and token logging.
 PRD compliance:
   • Providers: google_pro(gemini-2.0-flash), z_ai, openrouter(granite-3.1), free(ollama/llama3).
   • Tiers: low, med, high.
-  • SQLite: data/token_log.db
+  • SQLite: data/token_log.db (rows batched by a background writer thread)
 """
 
 import asyncio
+import atexit
+import functools
 import logging
 import os
+import queue
+import random
 import sqlite3
+import threading
 import time
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
-from dotenv import load_dotenv
-
 import cache
 
-load_dotenv()
-
 log = logging.getLogger("hexclaw.inference")
 
 # ── Config ────────────────────────────────────────────────────────────────────
-from config import DATA_DIR, TOKEN_LOG_DB
+from config import TOKEN_LOG_DB
 
 # Providers
 PROVIDERS = {
@@ -38,153 +42,490 @@ PROVIDERS = {
 
 # Tiers
 TIERS = {
-    "high": [PROVIDERS["google_pro"], PROVIDERS["openrouter"]],
-    "med":  [PROVIDERS["z_ai"], PROVIDERS["openrouter"]],
-    "low":  [PROVIDERS["z_ai"], PROVIDERS["free"]]
+    "high": (PROVIDERS["google_pro"], PROVIDERS["openrouter"]),
+    "med":  (PROVIDERS["z_ai"], PROVIDERS["openrouter"]),
+    "low":  (PROVIDERS["z_ai"], PROVIDERS["free"])
+}
+
+MAX_TOKENS = {"high": 2048, "med": 2048, "low": 2048}
+
+# Resolved once at import: one lookup per call gives the rotation and limits
+TierConfig = namedtuple("TierConfig", "rotation max_tokens")
+TIER_CONFIGS: dict[str, TierConfig] = {
+    t: TierConfig(rotation=TIERS[t], max_tokens=MAX_TOKENS[t]) for t in TIERS
 }
 
+# Output cap for a model reached from another tier's rotation: the smallest
+# max_tokens of the tiers it serves. A tier's own models keep its max_tokens.
+_MODEL_MAX_TOKENS: dict[str, int] = {
+    m: min(MAX_TOKENS[t] for t, served in TIERS.items() if m in served)
+    for models in TIERS.values() for m in models
+}
+
+def _tier_config(complexity: str) -> TierConfig:
+    cfg = TIER_CONFIGS.get(complexity)
+    if cfg is None:
+        raise ValueError(f"Unknown tier {complexity!r} (expected one of {', '.join(TIER_CONFIGS)})")
+    return cfg
+
+# On failure a call moves to the next model in its tier after
+# RETRY_BACKOFF_BASE ** n seconds plus up to RETRY_JITTER_SEC of random jitter,
+# so concurrent callers hitting the same 429 do not retry in lock-step.
+RETRY_BACKOFF_BASE: float = float(os.getenv("RETRY_BACKOFF_BASE", "2"))
+RETRY_JITTER_SEC: float = float(os.getenv("RETRY_JITTER_SEC", "1"))
+
+def _backoff(attempt: int) -> float:
+    return RETRY_BACKOFF_BASE ** (attempt - 1) + random.uniform(0, RETRY_JITTER_SEC)
+
+# Circuit breaker: a model that fails with a rate-limit/quota/auth error is
+# skipped for PROVIDER_COOLDOWN_SEC instead of being retried on every call.
+PROVIDER_COOLDOWN_SEC: float = float(os.getenv("PROVIDER_COOLDOWN_SEC", "30"))
+_TRIP_MARKERS = ("ratelimit", "quota", "auth", "429")
+_cooldown: dict[str, float] = {}
+
+def _rotation(models: tuple[str, ...]) -> tuple[str, ...]:
+    """Tier models minus those cooling down (all of them if every one is)."""
+    now = time.monotonic()
+    live = tuple(m for m in models if _cooldown.get(m, 0) <= now)
+    if len(live) < len(models):
+        log.debug(f"Skipping cooled-down models: {sorted(set(models) - set(live))}")
+    return live or models
+
+# At most LLM_INFLIGHT_LIMIT concurrent async requests per provider, so a burst
+# of ask() calls queues locally instead of drawing a wall of 429s. Semaphores
+# are bound to an event loop, hence one set per running loop.
+LLM_INFLIGHT_LIMIT: int = int(os.getenv("LLM_INFLIGHT_LIMIT", "4"))
+_inflight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = weakref.WeakKeyDictionary()
+
+def _provider_slot(model: str) -> asyncio.Semaphore:
+    sems = _inflight.setdefault(asyncio.get_running_loop(), {})
+    provider = model.split("/")[0]
+    if provider not in sems:
+        sems[provider] = asyncio.Semaphore(LLM_INFLIGHT_LIMIT)
+    return sems[provider]
+
+# Blocking per-call work around the LLM (Redis round-trips, prompt embedding
+# for the semantic cache) runs here, off the event loop and out of the
+# default executor that data queries and other to_thread() users share.
+LLM_EXECUTOR_WORKERS: int = int(os.getenv("LLM_EXECUTOR_WORKERS", "4"))
+_llm_exec = ThreadPoolExecutor(max_workers=LLM_EXECUTOR_WORKERS, thread_name_prefix="llm-inference")
+atexit.register(_llm_exec.shutdown, wait=False)
+
+async def _cache_io(fn, *args, **kwargs):
+    """Run a cache call on _llm_exec, or inline when cache.blocking() says it cannot block."""
+    if cache.blocking():
+        return await asyncio.get_running_loop().run_in_executor(_llm_exec, functools.partial(fn, *args, **kwargs))
+    return fn(*args, **kwargs)
+
+# Identical requests already in flight on the same loop share one live call
+_pending: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, asyncio.Task]] = weakref.WeakKeyDictionary()
+
+def _trip(model: str, error: Exception) -> None:
+    """Open the breaker for *model* if *error* looks like a quota/auth failure."""
+    text = f"{type(error).__name__} {error}".lower().replace("_", "")
+    if any(marker in text for marker in _TRIP_MARKERS):
+        _cooldown[model] = time.monotonic() + PROVIDER_COOLDOWN_SEC
+        log.warning(f"{model} cooling down for {PROVIDER_COOLDOWN_SEC:.0f}s: {type(error).__name__}")
+
 try:
     import litellm
     LITELLM_AVAILABLE = True
 except ImportError:
     litellm = None
     LITELLM_AVAILABLE = False
+    log.warning("LiteLLM not available — ask() will return stub responses")
 
 # ── Database ──────────────────────────────────────────────────────────────────
 _db_ready = False
 
+# One process-wide connection for all token-log reads and writes. sqlite3's
+# per-connection statement cache keeps _INSERT_SQL/_SUMMARY_UPSERT_SQL compiled,
+# so a flush is bind+step only — no open/close or re-parse per call.
+_db_conn: sqlite3.Connection | None = None
+_db_lock = threading.Lock()
+
+# log_tokens() only enqueues; a daemon writer thread drains the queue and
+# commits up to TOKEN_LOG_BATCH_SIZE rows per transaction, waiting at most
+# TOKEN_LOG_FLUSH_SEC for a batch to fill. Reads and exit flush explicitly.
+TOKEN_LOG_BATCH_SIZE: int = int(os.getenv("TOKEN_LOG_BATCH_SIZE", "500"))
+TOKEN_LOG_FLUSH_SEC: float = float(os.getenv("TOKEN_LOG_FLUSH_SEC", "0.05"))
+
+_INSERT_SQL = (
+    "INSERT INTO token_log (provider, model, tier, tokens_in, tokens_out, cost, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_log_queue: queue.Queue[tuple] = queue.Queue(maxsize=10_000)
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+# token_log_summary keeps running totals per (provider, model, tier), updated
+# in the same transaction as each batch insert, so usage reads never scan the log
+_SUMMARY_UPSERT_SQL = (
+    "INSERT INTO token_log_summary (provider, model, tier, calls, tok_in, tok_out, cost) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (provider, model, tier) DO UPDATE SET "
+    "calls = calls + excluded.calls, tok_in = tok_in + excluded.tok_in, "
+    "tok_out = tok_out + excluded.tok_out, cost = cost + excluded.cost"
+)
+
+# In-process usage totals per (provider, model, tier) -> [calls, tok_in,
+# tok_out, cost]: seeded once from token_log_summary, then bumped by
+# log_tokens(), so usage reads are a dict snapshot with no flush or disk I/O.
+# Rows logged by other processes after the seed show up after a restart.
+_SUMMARY_SELECT_SQL = "SELECT provider, model, tier, calls, tok_in, tok_out, cost FROM token_log_summary"
+_totals: dict[tuple[str, str, str], list] | None = None
+_totals_lock = threading.Lock()
+
 def init_db():
-    """Create token_log table if it doesn't exist.  Safe to call multiple times."""
-    global _db_ready
-    if _db_ready:
-        return
-    DATA_DIR.mkdir(exist_ok=True)
-    conn = sqlite3.connect(TOKEN_LOG_DB)
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS token_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            provider TEXT,
-            model TEXT,
-            tier TEXT,
-            tokens_in INTEGER,
-            tokens_out INTEGER,
-            cost REAL,
-            created_at TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
-    _db_ready = True
+    """Open the shared connection and create token_log if needed.  Safe to call multiple times."""
+    global _db_ready, _db_conn
+    with _db_lock:
+        if _db_ready:
+            return
+        conn = sqlite3.connect(TOKEN_LOG_DB, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL is persistent in the DB file: readers (/stats) never block batch writes.
+        # NORMAL only fsyncs at checkpoints, which WAL keeps crash-consistent.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=67108864")
+        # sqlite3 runs DDL in autocommit unless a transaction is open: apply the
+        # schema and summary backfill as one commit, so a crash in between can
+        # never leave an empty token_log_summary that is then taken as complete
+        conn.execute("BEGIN")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS token_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                provider TEXT,
+                model TEXT,
+                tier TEXT,
+                tokens_in INTEGER,
+                tokens_out INTEGER,
+                cost REAL,
+                created_at TEXT
+            )
+        """)
+        has_summary = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'token_log_summary'"
+        ).fetchone()
+        if not has_summary:
+            conn.execute("""
+                CREATE TABLE token_log_summary (
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    tier TEXT NOT NULL,
+                    calls INTEGER NOT NULL,
+                    tok_in INTEGER NOT NULL,
+                    tok_out INTEGER NOT NULL,
+                    cost REAL NOT NULL,
+                    PRIMARY KEY (provider, model, tier)
+                )
+            """)
+            # Backfill from rows logged before the summary existed
+            conn.execute("""
+                INSERT INTO token_log_summary
+                SELECT COALESCE(provider, ''), COALESCE(model, ''), COALESCE(tier, ''),
+                       COUNT(*), COALESCE(SUM(tokens_in), 0), COALESCE(SUM(tokens_out), 0), COALESCE(SUM(cost), 0)
+                FROM token_log
+                GROUP BY 1, 2, 3
+            """)
+        conn.commit()
+        _db_conn = conn
+        _db_ready = True
 
-def _ensure_db():
-    """Lazily initialise the token log DB on first write/read."""
+def _ensure_db() -> sqlite3.Connection:
+    """Lazily initialise the token log DB on first write/read; returns the shared connection."""
     if not _db_ready:
         init_db()
+    return _db_conn
 
-def log_tokens(provider: str, model: str, tier: str, tokens_in: int, tokens_out: int, cost: float = 0.0):
+def _write_rows(rows: list[tuple]) -> int:
+    """
+    INSERT *rows* and fold them into token_log_summary, in one transaction on
+    the shared connection. Returns rows written.
+    """
+    totals: dict[tuple, list] = {}
+    for provider, model, tier, tokens_in, tokens_out, cost, _ in rows:
+        t = totals.setdefault((provider or "", model or "", tier or ""), [0, 0, 0, 0.0])
+        t[0] += 1
+        t[1] += tokens_in or 0
+        t[2] += tokens_out or 0
+        t[3] += cost or 0.0
     try:
-        _ensure_db()
-        conn = sqlite3.connect(TOKEN_LOG_DB)
-        conn.execute(
-            "INSERT INTO token_log (provider, model, tier, tokens_in, tokens_out, cost, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (provider, model, tier, tokens_in, tokens_out, cost, datetime.now(timezone.utc).isoformat())
-        )
-        conn.commit()
-        conn.close()
+        conn = _ensure_db()
+        with _db_lock, conn:
+            conn.executemany(_INSERT_SQL, rows)
+            conn.executemany(_SUMMARY_UPSERT_SQL, [(*key, *t) for key, t in totals.items()])
     except Exception as e:
         log.error(f"Failed to log tokens: {e}")
+        return 0
+    return len(rows)
+
+def _drain(rows: list[tuple], wait: float = 0.0) -> list[tuple]:
+    """Top *rows* up from the queue to TOKEN_LOG_BATCH_SIZE, waiting up to *wait* seconds."""
+    deadline = time.monotonic() + wait
+    while len(rows) < TOKEN_LOG_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        try:
+            rows.append(_log_queue.get(timeout=remaining) if remaining > 0 else _log_queue.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+def _writer_loop() -> None:
+    while True:
+        rows = _drain([_log_queue.get()], TOKEN_LOG_FLUSH_SEC)
+        _write_rows(rows)
+        for _ in rows:
+            _log_queue.task_done()
+
+def _ensure_writer() -> None:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_writer_loop, name="token-log-writer", daemon=True)
+                _writer.start()
+
+def flush_token_log() -> int:
+    """
+    Write every queued token-log row now and wait for the writer's in-flight
+    batch, so a following read sees all logged calls. Returns rows written here.
+    """
+    written = 0
+    while rows := _drain([]):
+        written += _write_rows(rows)
+        for _ in rows:
+            _log_queue.task_done()
+    _log_queue.join()
+    return written
+
+atexit.register(flush_token_log)
+
+def log_tokens(provider: str, model: str, tier: str, tokens_in: int, tokens_out: int, cost: float = 0.0):
+    """Enqueue a token-log row; the background writer INSERTs it in a batch."""
+    row = (provider, model, tier, tokens_in, tokens_out, cost, datetime.now(timezone.utc).isoformat())
+    _ensure_writer()
+    with _totals_lock:
+        _log_queue.put(row)  # blocks only if the writer is 10k rows behind
+        if _totals is not None:
+            t = _totals.setdefault((provider or "", model or "", tier or ""), [0, 0, 0, 0.0])
+            t[0] += 1
+            t[1] += tokens_in or 0
+            t[2] += tokens_out or 0
+            t[3] += cost or 0.0
+
+def _usage_totals() -> dict[tuple[str, str, str], list]:
+    """Snapshot of the usage totals, seeding them from token_log_summary on first use."""
+    global _totals
+    with _totals_lock:
+        if _totals is None:
+            # Under _totals_lock no row can be enqueued, so after the flush the
+            # table holds exactly what log_tokens() has seen so far
+            flush_token_log()
+            conn = _ensure_db()
+            with _db_lock:
+                rows = conn.execute(_SUMMARY_SELECT_SQL).fetchall()
+            _totals = {(p, m, t): [c, i, o, cost] for p, m, t, c, i, o, cost in rows}
+        return {key: list(t) for key, t in _totals.items()}
+
+@functools.lru_cache(maxsize=None)
+def _api_base(model: str) -> str | None:
+    """Custom endpoint for *model*, resolved once per model name."""
+    if "openai/" in model and "glm" in model:
+        # Special routing for Z.ai OpenAI-compatible endpoint
+        return "https://api.z.ai/api/coding/paas/v4"
+    if "anthropic/" in model and "glm" in model:
+        # Fallback/alternative routing through Z.ai's Anthropic endpoint
+        return "https://api.z.ai/api/anthropic"
+    return None
 
 # ── Inference Engine ──────────────────────────────────────────────────────────
 class InferenceEngine:
     def select_model(self, complexity: str) -> str:
         """Complexity: low, med, high -> returns first available model in tier."""
-        tier = TIERS.get(complexity, TIERS["low"])
-        return tier[0]
+        return _tier_config(complexity).rotation[0]
 
-    async def ask(self, prompt: str, complexity: str = "low", system: str = "You are HexClaw.") -> str:
-        # ── Cache check first ─────────────────────────────────────────────────
-        hit = cache.get(f"{system}\n\n{prompt}")
+    def _cached(self, prompt: str, complexity: str, system: str) -> str | None:
+        hit = cache.get(prompt, system=system)
         if hit:
             log.info(f"Cache HIT for tier={complexity} — 0 tokens, $0.00")
             log_tokens("cache", "exact-semantic", complexity, 0, 0, 0.0)
-            return hit
+        return hit
 
-        if not LITELLM_AVAILABLE:
-            log.warning("LiteLLM not available. Returning stub response.")
-            return f"[LiteLLM Stub] {prompt[:50]}..."
+    @staticmethod
+    def _messages(prompt: str, system: str) -> list[dict]:
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _request(self, model: str, messages: list[dict], complexity: str, max_tokens: int,
+                 json_mode: bool = False) -> dict:
+        """Build the LiteLLM completion kwargs (model, messages, provider routing)."""
+        log.info(f"LLM call: model={model} tier={complexity} prompt_len={len(messages[-1]['content'])}")
 
-        model = self.select_model(complexity)
-        log.info(f"LLM call: model={model} tier={complexity} prompt_len={len(prompt)}")
-        
         # ── Provider specific logic ───────────────────────────────────────────
+        if model not in TIERS.get(complexity, ()):
+            max_tokens = min(max_tokens, _MODEL_MAX_TOKENS.get(model, max_tokens))
         kwargs = {}
-        if "openai/" in model and "glm" in model:
-            # Special routing for Z.ai OpenAI-compatible endpoint
-            kwargs["api_base"] = "https://api.z.ai/api/coding/paas/v4"
-            kwargs["api_key"] = os.getenv("ZHIPUAI_API_KEY")
-        elif "anthropic/" in model and "glm" in model:
-            # Fallback/alternative routing through Z.ai's Anthropic endpoint
-            kwargs["api_base"] = "https://api.z.ai/api/anthropic"
+        api_base = _api_base(model)
+        if api_base:
+            kwargs["api_base"] = api_base
             kwargs["api_key"] = os.getenv("ZHIPUAI_API_KEY")
+        if json_mode:
+            # Constrain decoding to a JSON object: no fences for callers to strip
+            kwargs["response_format"] = {"type": "json_object"}
 
-        try:
-            response = await litellm.acompletion(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2048,
-                **kwargs
-            )
-            
-            text = response.choices[0].message.content
-            usage = response.usage
-            u_in = getattr(usage, "prompt_tokens", 0) or 0
-            u_out = getattr(usage, "completion_tokens", 0) or 0
-            cost = getattr(response, "_hidden_params", {}).get("response_cost") or 0.0
-            
-            log.info(f"LLM response: {u_in}↑ {u_out}↓ tokens · ${float(cost):.4f} · {len(text)} chars")
-            
+        return dict(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+
+    def _record(self, response: Any, model: str, complexity: str, elapsed: float) -> str:
+        """Log usage and return the response text (callers store it in the cache)."""
+        text = response.choices[0].message.content
+        usage = response.usage
+        if usage is not None:
+            u_in, u_out = usage.prompt_tokens, usage.completion_tokens
+        else:
+            u_in = u_out = 0
+        hidden = getattr(response, "_hidden_params", None)
+        raw_cost = hidden.get("response_cost") if hidden else None
+        cost = float(raw_cost) if raw_cost is not None else 0.0
+
+        log.info(f"LLM response: {u_in}↑ {u_out}↓ tokens · ${cost:.4f} · {len(text)} chars · {elapsed:.2f}s")
+
+        log_tokens(
+            provider=model.split("/")[0],
+            model=model,
+            tier=complexity,
+            tokens_in=u_in,
+            tokens_out=u_out,
+            cost=cost
+        )
+        return text
+
+    async def ask(self, prompt: str, complexity: str = "low", system: str = "You are HexClaw.",
+                  json_mode: bool = False) -> str:
+        cfg = _tier_config(complexity)
+
+        # ── Cache check first ─────────────────────────────────────────────────
+        # The cache is keyed on (system, prompt) alone, so json_mode answers
+        # neither read nor write it: free text must never answer a JSON call
+        hit = None if json_mode else await _cache_io(self._cached, prompt, complexity, system)
+        if hit:
+            return hit
+
+        if not LITELLM_AVAILABLE:
+            log.debug("LiteLLM not available. Returning stub response.")
+            return f"[LiteLLM Stub] {prompt[:50]}..."
+
+        # ── Coalesce with an identical in-flight request ──────────────────────
+        pending = _pending.setdefault(asyncio.get_running_loop(), {})
+        key = (complexity, system, prompt, json_mode)
+        task = pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._ask_live(prompt, complexity, system, cfg, json_mode))
+            pending[key] = task
+            task.add_done_callback(lambda _: pending.pop(key, None))
+        else:
+            log.info(f"Coalesced with in-flight request for tier={complexity} — 0 tokens")
+        # shield: one caller being cancelled must not cancel the shared call
+        return await asyncio.shield(task)
+
+    async def _ask_live(self, prompt: str, complexity: str, system: str, cfg: TierConfig,
+                        json_mode: bool) -> str:
+        """Provider call with tier rotation, backoff and circuit breaker."""
+        messages = self._messages(prompt, system)
+        error: Exception | None = None
+        for attempt, model in enumerate(_rotation(cfg.rotation)):
+            if attempt:
+                await asyncio.sleep(_backoff(attempt))
+            request = self._request(model, messages, complexity, cfg.max_tokens, json_mode)
+            try:
+                async with _provider_slot(model):
+                    started = time.monotonic()
+                    response = await litellm.acompletion(**request)
+                _cooldown.pop(model, None)
+                text = self._record(response, model, complexity, time.monotonic() - started)
+            except Exception as e:
+                log.error(f"Inference FAILED for {model}: {e}")
+                _trip(model, e)
+                error = e
+                continue
             # ── Store in cache ────────────────────────────────────────────────
-            cache.set(f"{system}\n\n{prompt}", text)
-            
-            log_tokens(
-                provider=model.split("/")[0],
-                model=model,
-                tier=complexity,
-                tokens_in=usage.prompt_tokens,
-                tokens_out=usage.completion_tokens,
-                cost=cost
-            )
+            if not json_mode:
+                await _cache_io(cache.set, prompt, text, system=system)
             return text
-        except Exception as e:
-            log.error(f"Inference FAILED for {model}: {e}")
-            return f"Error: {e}"
+        return f"Error: {error}"
 
-    def ask_sync(self, prompt: str, complexity: str = "low") -> str:
-        return asyncio.run(self.ask(prompt, complexity))
+    def ask_sync(self, prompt: str, complexity: str = "low", system: str = "You are HexClaw.",
+                 json_mode: bool = False) -> str:
+        """
+        Blocking ask() for sync callers (CLI, threads): same cache/logging path,
+        but calls litellm.completion directly — no event loop involved.
+        Async code should await ask(). json_mode asks the provider for a bare
+        JSON object (response_format) instead of free text.
+        """
+        cfg = _tier_config(complexity)
+        hit = None if json_mode else self._cached(prompt, complexity, system)
+        if hit:
+            return hit
+
+        if not LITELLM_AVAILABLE:
+            log.debug("LiteLLM not available. Returning stub response.")
+            return f"[LiteLLM Stub] {prompt[:50]}..."
+
+        messages = self._messages(prompt, system)
+        error: Exception | None = None
+        for attempt, model in enumerate(_rotation(cfg.rotation)):
+            if attempt:
+                time.sleep(_backoff(attempt))
+            request = self._request(model, messages, complexity, cfg.max_tokens, json_mode)
+            try:
+                started = time.monotonic()
+                response = litellm.completion(**request)
+                _cooldown.pop(model, None)
+                text = self._record(response, model, complexity, time.monotonic() - started)
+            except Exception as e:
+                log.error(f"Inference FAILED for {model}: {e}")
+                _trip(model, e)
+                error = e
+                continue
+            if not json_mode:
+                cache.set(prompt, text, system=system)
+            return text
+        return f"Error: {error}"
 
 def usage_report() -> dict:
-    _ensure_db()
-    conn = sqlite3.connect(TOKEN_LOG_DB)
-    conn.row_factory = sqlite3.Row
-    stats = conn.execute("""
-        SELECT 
-            tier, 
-            SUM(tokens_in) as total_in, 
-            SUM(tokens_out) as total_out, 
-            SUM(cost) as total_cost 
-        FROM token_log GROUP BY tier
-    """).fetchall()
-    conn.close()
-    return {row['tier']: dict(row) for row in stats}
+    """Per-tier token/cost totals from the in-process usage counters."""
+    report: dict[str, dict] = {}
+    for (_, _, tier), (_, tok_in, tok_out, cost) in _usage_totals().items():
+        r = report.setdefault(tier, {"tier": tier, "total_in": 0, "total_out": 0, "total_cost": 0.0})
+        r["total_in"] += tok_in
+        r["total_out"] += tok_out
+        r["total_cost"] += cost
+    return report
+
+def usage_by_model() -> list[tuple]:
+    """(provider, model, calls, tok_in, tok_out, cost) per model, costliest first."""
+    by_model: dict[tuple[str, str], list] = {}
+    for (provider, model, _), t in _usage_totals().items():
+        m = by_model.setdefault((provider, model), [0, 0, 0, 0.0])
+        for i, v in enumerate(t):
+            m[i] += v
+    return sorted(((*key, *m) for key, m in by_model.items()), key=lambda r: r[5], reverse=True)
 
 # Singleton instance
 engine = InferenceEngine()
 
-async def ask(prompt: str, complexity: str = "low", system: str = "You are HexClaw.") -> str:
-    return await engine.ask(prompt, complexity, system)
+async def ask(prompt: str, complexity: str = "low", system: str = "You are HexClaw.",
+              json_mode: bool = False) -> str:
+    return await engine.ask(prompt, complexity, system, json_mode)
 
 if __name__ == "__main__":
     import json
@@ -3,7 +3,7 @@
 HexClaw install.py
 ==================
 Bootstraps everything needed to run the HexClaw autonomous agent:
-  1. Python pip dependencies (litellm, redis, telegram, duckdb, msgraph, google-api)
+  1. Python pip dependencies (litellm, redis, telegram, duckdb, pyarrow, msgraph, google-api)
   2. .env configuration (Telegram, AI keys, Email/App passwords)
   3. Database setup (PostgreSQL + Redis)
   4. System service registration (systemd/Windows)
@@ -16,11 +16,18 @@ import platform
 import subprocess
 import argparse
 import textwrap
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 ROOT = Path(__file__).parent.resolve()
 ENV_FILE = ROOT / ".env"
+TOOLS_SCRIPT = ROOT / "install_tools.sh"
+# Persistent pip cache: re-runs reuse downloaded/built wheels instead of refetching
+PIP_CACHE = ROOT / ".pip-cache"
 REQUIREMENTS = [
     "litellm",
     "redis",
@@ -28,11 +35,18 @@ REQUIREMENTS = [
     "temp-mails",
     "psycopg2-binary",
     "duckdb",
+    "pyarrow",
     "msgraph-sdk",
     "google-api-python-client",
     "python-dotenv",
     "pyyaml"
 ]
+# Never build these from source: a wheel exists for every supported platform
+BINARY_ONLY = ["psycopg2-binary", "duckdb", "pyarrow"]
+SKILLS_REPO = "sickn33/antigravity-awesome-skills"
+# Optional fully pinned, hashed closure of REQUIREMENTS (e.g. from
+# `uv pip compile --generate-hashes`); when present, installs skip resolution
+LOCK_FILE = ROOT / "requirements.lock"
 
 BOLD = "\033[1m"
 GREEN = "\033[32m"
@@ -41,834 +55,112 @@ RED = "\033[31m"
 CYAN = "\033[36m"
 RESET = "\033[0m"
 
-def ok(msg): print(f"  {GREEN}[+]{RESET} {msg}")
-def warn(msg): print(f"  {YELLOW}[?]{RESET}  {msg}")
-def err(msg): print(f"  {RED}[X]{RESET} {msg}")
-def header(msg): print(f"\n{BOLD}{CYAN}== {msg} =={RESET}")
+# Steps may run on worker threads (see main); keep each status line whole
+_print_lock = threading.Lock()
+# Worker output queued while the main thread is prompting (see _prompting)
+_held = None
+
+def _say(line):
+    with _print_lock:
+        if _held is not None and threading.current_thread() is not threading.main_thread():
+            _held.append(line)
+        else:
+            print(line, flush=True)
+
+@contextmanager
+def _prompting():
+    """Keep worker-thread output off the terminal while input() owns it."""
+    global _held
+    with _print_lock:
+        _held = []
+    try:
+        yield
+    finally:
+        with _print_lock:
+            held, _held = _held, None
+            for line in held:
+                print(line, flush=True)
+
+def ok(msg): _say(f"  {GREEN}[+]{RESET} {msg}")
+def warn(msg): _say(f"  {YELLOW}[?]{RESET}  {msg}")
+def err(msg): _say(f"  {RED}[X]{RESET} {msg}")
+def header(msg): _say(f"\n{BOLD}{CYAN}== {msg} =={RESET}")
+
+def run_streaming(cmd):
+    """check_call() whose output is relayed line by line through _say()."""
+    # Python's own fds are non-inheritable (PEP 446), so there is nothing for
+    # close_fds to close; skipping it spares the per-spawn fd sweep
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+                          close_fds=False) as proc:
+        for line in proc.stdout:
+            _say(f"    {line.rstrip()}")
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 # ── Steps ─────────────────────────────────────────────────────────────────────
 
-def install_system_tools():
+def want_system_tools():
+    """Ask up front whether to run the tool script, so it can later run unattended."""
     header("Step 0: Verify and Install System Tools")
     if platform.system() != "Linux":
         warn("Not a Linux system. Skipping OS-level tool installation.")
-        return
-
+        return False
     choice = input(f"  {YELLOW}[?]{RESET} Run the HexStrike tool installation verification script? [y/N]: ").strip().lower()
-    if choice == 'y':
-        print("Running tool verification and installation script...")
-        script_content = r"""#!/bin/bash
-
-# HexStrike AI - Official Tools Verification Script (Based on Official README)
-# Supports multiple Linux distributions with verified download links
-# Version 3.5 - Complete coverage of all 70+ HexStrike AI tools
-
-RED='[0;31m'
-GREEN='[0;32m'
-YELLOW='[1;33m'
-BLUE='[0;34m'
-MAGENTA='[0;35m'
-CYAN='[0;36m'
-WHITE='[1;37m'
-ORANGE='[0;33m'
-NC='[0m' # No Color
-
-# Banner
-echo -e "${CYAN}"
-echo "██╗  ██╗███████╗██╗  ██╗███████╗████████╗██████╗ ██╗██╗  ██╗███████╗"
-echo "██║  ██║██╔════╝╚██╗██╔╝██╔════╝╚══██╔══╝██╔══██╗██║██║ ██╔╝██╔════╝"
-echo "███████║█████╗   ╚███╔╝ ███████╗   ██║   ██████╔╝██║█████╔╝ █████╗  "
-echo "██╔══██║██╔══╝   ██╔██╗ ╚════██║   ██║   ██╔══██╗██║██╔═██╗ ██╔══╝  "
-echo "██║  ██║███████╗██╔╝ ██╗███████║   ██║   ██║  ██║██║██║  ██╗███████╗"
-echo "╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚═╝╚═╝  ╚═╝╚══════╝"
-echo -e "${NC}"
-echo -e "${WHITE}HexStrike AI - Official Security Tools Checker v3.5 by Cipherbytes9${NC}"
-echo -e "${BLUE}🔗 Based on official HexStrike AI README - 70+ tools coverage${NC}"
-echo -e "${ORANGE}📋 Comprehensive verification with working download links${NC}"
-echo ""
-
-# Check if curl is available for link validation
-CURL_AVAILABLE=false
-if command -v curl > /dev/null 2>&1; then
-    CURL_AVAILABLE=true
-fi
-
-# Function to check if URL is accessible
-check_url() {
-    local url=$1
-    if [ "$CURL_AVAILABLE" = true ]; then
-        if curl --output /dev/null --silent --head --fail --max-time 10 "$url"; then
-            return 0
-        else
-            return 1
-        fi
-    else
-        return 0  # Assume working if curl not available
-    fi
-}
-
-# Detect Linux distribution
-detect_distro() {
-    if [ -f /etc/os-release ]; then
-        . /etc/os-release
-        DISTRO=$ID
-        VERSION=$VERSION_ID
-        PRETTY_NAME="$PRETTY_NAME"
-    elif [ -f /etc/redhat-release ]; then
-        DISTRO="rhel"
-        PRETTY_NAME=$(cat /etc/redhat-release)
-    elif [ -f /etc/debian_version ]; then
-        DISTRO="debian"
-        PRETTY_NAME="Debian $(cat /etc/debian_version)"
-    else
-        DISTRO="unknown"
-        PRETTY_NAME="Unknown Linux Distribution"
-    fi
-    
-    # Detect architecture
-    ARCH=$(uname -m)
-    case $ARCH in
-        x86_64) ARCH_TYPE="amd64" ;;
-        aarch64|arm64) ARCH_TYPE="arm64" ;;
-        armv7l) ARCH_TYPE="armv7" ;;
-        i686|i386) ARCH_TYPE="i386" ;;
-        *) ARCH_TYPE="amd64" ;;
-    esac
-    
-    echo -e "${BLUE}🐧 Detected OS: ${CYAN}$PRETTY_NAME${NC}"
-    echo -e "${BLUE}📋 Distribution: ${CYAN}$DISTRO${NC}"
-    echo -e "${BLUE}🏗️  Architecture: ${CYAN}$ARCH ($ARCH_TYPE)${NC}"
-    echo ""
-}
-
-# Get package manager and install commands based on distro
-get_package_manager() {
-    case $DISTRO in
-        "ubuntu"|"debian"|"kali"|"parrot"|"mint")
-            PKG_MANAGER="apt"
-            INSTALL_CMD="sudo apt update && sudo apt install -y"
-            UPDATE_CMD="sudo apt update"
-            ;;
-        "fedora"|"rhel"|"centos")
-            if command -v dnf > /dev/null 2>&1; then
-                PKG_MANAGER="dnf"
-                INSTALL_CMD="sudo dnf install -y"
-                UPDATE_CMD="sudo dnf update"
-            else
-                PKG_MANAGER="yum"
-                INSTALL_CMD="sudo yum install -y"
-                UPDATE_CMD="sudo yum update"
-            fi
-            ;;
-        "arch"|"manjaro"|"endeavouros")
-            PKG_MANAGER="pacman"
-            INSTALL_CMD="sudo pacman -S"
-            UPDATE_CMD="sudo pacman -Syu"
-            ;;
-        "opensuse"|"opensuse-leap"|"opensuse-tumbleweed")
-            PKG_MANAGER="zypper"
-            INSTALL_CMD="sudo zypper install -y"
-            UPDATE_CMD="sudo zypper update"
-            ;;
-        "alpine")
-            PKG_MANAGER="apk"
-            INSTALL_CMD="sudo apk add"
-            UPDATE_CMD="sudo apk update"
-            ;;
-        *)
-            PKG_MANAGER="unknown"
-            INSTALL_CMD="# Unknown package manager - manual installation required"
-            UPDATE_CMD="# Unknown package manager"
-            ;;
-    esac
-    
-    echo -e "${BLUE}📦 Package Manager: ${CYAN}$PKG_MANAGER${NC}"
-    echo ""
-}
-
-# Initialize counters
-INSTALLED_COUNT=0
-MISSING_COUNT=0
-TOTAL_COUNT=0
-
-# Arrays to store results
-INSTALLED_TOOLS=()
-MISSING_TOOLS=()
-
-# Complete tool installation database based on HexStrike AI README
-declare -A TOOL_INSTALL_INFO
-init_complete_tool_database() {
-    # 🔍 Network Reconnaissance & Scanning (from README)
-    TOOL_INSTALL_INFO["nmap"]="pkg_manager|nmap|Advanced port scanning with custom NSE scripts"
-    TOOL_INSTALL_INFO["amass"]="go_install|github.com/owasp-amass/amass/v4/cmd/amass|Comprehensive subdomain enumeration and OSINT"
-    TOOL_INSTALL_INFO["subfinder"]="go_install|github.com/projectdiscovery/subfinder/v2/cmd/subfinder|Fast passive subdomain discovery"
-    TOOL_INSTALL_INFO["nuclei"]="go_install|github.com/projectdiscovery/nuclei/v3/cmd/nuclei|Fast vulnerability scanner with 4000+ templates"
-    TOOL_INSTALL_INFO["autorecon"]="pip_install|autorecon|Automated reconnaissance with 35+ parameters"
-    TOOL_INSTALL_INFO["fierce"]="pip_install|fierce|DNS reconnaissance and zone transfer testing"
-    TOOL_INSTALL_INFO["masscan"]="pkg_manager|masscan|High-speed Internet-scale port scanner"
-    TOOL_INSTALL_INFO["rustscan"]="github_release|https://github.com/bee-san/RustScan/releases/download/2.3.0/rustscan_2.3.0_amd64.deb|Rust-based port scanner"
-    TOOL_INSTALL_INFO["dnsenum"]="pkg_manager|dnsenum|DNS enumeration tool"
-    TOOL_INSTALL_INFO["theharvester"]="pkg_manager|theharvester|Email/subdomain harvester"
-    TOOL_INSTALL_INFO["responder"]="pkg_manager|responder|LLMNR/NBT-NS/MDNS poisoner"
-    TOOL_INSTALL_INFO["netexec"]="pip_install|netexec|Network service exploitation tool"
-    TOOL_INSTALL_INFO["enum4linux-ng"]="github_manual|https://github.com/cddmp/enum4linux-ng|Next-generation enum4linux"
-    
-    # 🌐 Web Application Security Testing (from README)
-    TOOL_INSTALL_INFO["gobuster"]="pkg_manager|gobuster|Directory, file, and DNS enumeration"
-    TOOL_INSTALL_INFO["ffuf"]="pkg_manager|ffuf|Fast web fuzzer with advanced filtering capabilities"
-    TOOL_INSTALL_INFO["dirb"]="pkg_manager|dirb|Comprehensive web content scanner"
-    TOOL_INSTALL_INFO["nikto"]="pkg_manager|nikto|Web server vulnerability scanner"
-    TOOL_INSTALL_INFO["sqlmap"]="pkg_manager|sqlmap|Advanced automatic SQL injection testing"
-    TOOL_INSTALL_INFO["wpscan"]="pkg_manager|wpscan|WordPress security scanner with vulnerability database"
-    TOOL_INSTALL_INFO["burpsuite"]="manual_download|https://portswigger.net/burp/releases|Professional web security testing platform"
-    TOOL_INSTALL_INFO["zaproxy"]="pkg_manager|zaproxy|OWASP ZAP web application security scanner"
-    TOOL_INSTALL_INFO["arjun"]="pip_install|arjun|HTTP parameter discovery tool"
-    TOOL_INSTALL_INFO["wafw00f"]="pkg_manager|wafw00f|Web application firewall fingerprinting"
-    TOOL_INSTALL_INFO["feroxbuster"]="github_release|https://github.com/epi052/feroxbuster/releases/latest/download/x86_64-linux-feroxbuster.tar.gz|Fast content discovery tool"
-    TOOL_INSTALL_INFO["dotdotpwn"]="github_manual|https://github.com/wireghoul/dotdotpwn|Directory traversal fuzzer"
-    TOOL_INSTALL_INFO["xsser"]="pkg_manager|xsser|Cross-site scripting detection and exploitation"
-    TOOL_INSTALL_INFO["wfuzz"]="pkg_manager|wfuzz|Web application fuzzer"
-    TOOL_INSTALL_INFO["dirsearch"]="github_manual|https://github.com/maurosoria/dirsearch|Web path discovery tool"
-    TOOL_INSTALL_INFO["httpx"]="go_install|github.com/projectdiscovery/httpx/cmd/httpx|HTTP toolkit"
-    TOOL_INSTALL_INFO["katana"]="go_install|github.com/projectdiscovery/katana/cmd/katana|Web crawler"
-    TOOL_INSTALL_INFO["paramspider"]="github_manual|https://github.com/devanshbatham/ParamSpider|Parameter mining tool"
-    TOOL_INSTALL_INFO["dalfox"]="go_install|github.com/hahwul/dalfox/v2|XSS scanner and utility"
-    
-    # 🔐 Authentication & Password Security (from README)
-    TOOL_INSTALL_INFO["hydra"]="pkg_manager|hydra|Network login cracker supporting 50+ protocols"
-    TOOL_INSTALL_INFO["john"]="pkg_manager|john|Advanced password hash cracking"
-    TOOL_INSTALL_INFO["hashcat"]="pkg_manager|hashcat|World's fastest password recovery tool"
-    TOOL_INSTALL_INFO["medusa"]="pkg_manager|medusa|Speedy, parallel, modular login brute-forcer"
-    TOOL_INSTALL_INFO["patator"]="pkg_manager|patator|Multi-purpose brute-forcer"
-    TOOL_INSTALL_INFO["crackmapexec"]="pip_install|crackmapexec|Swiss army knife for pentesting networks"
-    TOOL_INSTALL_INFO["evil-winrm"]="pkg_manager|evil-winrm|Windows Remote Management shell"
-    TOOL_INSTALL_INFO["hash-identifier"]="pkg_manager|hash-identifier|Hash type identifier"
-    TOOL_INSTALL_INFO["ophcrack"]="pkg_manager|ophcrack|Windows password cracker"
-    
-    # 🔬 Binary Analysis & Reverse Engineering (from README)
-    TOOL_INSTALL_INFO["gdb"]="pkg_manager|gdb|GNU Debugger with Python scripting"
-    TOOL_INSTALL_INFO["radare2"]="pkg_manager|radare2|Advanced reverse engineering framework"
-    TOOL_INSTALL_INFO["binwalk"]="pkg_manager|binwalk|Firmware analysis and extraction tool"
-    TOOL_INSTALL_INFO["ropgadget"]="pip_install|ropgadget|ROP/JOP gadget finder"
-    TOOL_INSTALL_INFO["checksec"]="pkg_manager|checksec|Binary security property checker"
-    TOOL_INSTALL_INFO["strings"]="pkg_manager|binutils|Extract printable strings from binaries"
-    TOOL_INSTALL_INFO["objdump"]="pkg_manager|binutils|Display object file information"
-    TOOL_INSTALL_INFO["ghidra"]="manual_download|https://github.com/NationalSecurityAgency/ghidra/releases|NSA's software reverse engineering suite"
-    TOOL_INSTALL_INFO["xxd"]="pkg_manager|xxd|Hex dump utility"
-    TOOL_INSTALL_INFO["volatility3"]="pip_install|volatility3|Memory forensics framework"
-    TOOL_INSTALL_INFO["foremost"]="pkg_manager|foremost|File carving tool"
-    TOOL_INSTALL_INFO["steghide"]="pkg_manager|steghide|Steganography tool"
-    TOOL_INSTALL_INFO["exiftool"]="pkg_manager|libimage-exiftool-perl|Metadata reader/writer"
-    
-    # 🏆 Advanced CTF & Forensics Tools (from README)
-    TOOL_INSTALL_INFO["volatility3"]="pip_install|volatility3|Advanced memory forensics framework"
-    TOOL_INSTALL_INFO["foremost"]="pkg_manager|foremost|File carving and data recovery"
-    TOOL_INSTALL_INFO["steghide"]="pkg_manager|steghide|Steganography detection and extraction"
-    TOOL_INSTALL_INFO["exiftool"]="pkg_manager|libimage-exiftool-perl|Metadata reader/writer for various file formats"
-    TOOL_INSTALL_INFO["hashpump"]="github_manual|https://github.com/cipherbytes9/HashPump|Hash length extension attack tool"
-    TOOL_INSTALL_INFO["sleuthkit"]="pkg_manager|sleuthkit|Collection of command-line digital forensics tools"
-    
-    # ☁️ Cloud & Container Security (from README)
-    TOOL_INSTALL_INFO["prowler"]="pip_install|prowler-cloud|AWS/Azure/GCP security assessment tool"
-    TOOL_INSTALL_INFO["trivy"]="github_release|https://github.com/aquasecurity/trivy/releases/latest/download/trivy_0.50.1_Linux-64bit.tar.gz|Comprehensive vulnerability scanner for containers"
-    TOOL_INSTALL_INFO["scout-suite"]="pip_install|scoutsuite|Multi-cloud security auditing tool"
-    TOOL_INSTALL_INFO["kube-hunter"]="pip_install|kube-hunter|Kubernetes penetration testing tool"
-    TOOL_INSTALL_INFO["kube-bench"]="github_release|https://github.com/aquasecurity/kube-bench/releases/latest/download/kube-bench_0.6.17_linux_amd64.tar.gz|CIS Kubernetes benchmark checker"
-    TOOL_INSTALL_INFO["cloudsploit"]="github_manual|https://github.com/aquasecurity/cloudsploit|Cloud security scanning and monitoring"
-    
-    # 🔥 Bug Bounty & Reconnaissance Arsenal (from README)
-    TOOL_INSTALL_INFO["hakrawler"]="go_install|github.com/hakluke/hakrawler|Fast web endpoint discovery and crawling"
-    TOOL_INSTALL_INFO["httpx"]="go_install|github.com/projectdiscovery/httpx/cmd/httpx|Fast and multi-purpose HTTP toolkit"
-    TOOL_INSTALL_INFO["paramspider"]="github_manual|https://github.com/devanshbatham/ParamSpider|Mining parameters from dark corners of web archives"
-    TOOL_INSTALL_INFO["aquatone"]="github_release|https://github.com/michenriksen/aquatone/releases/latest/download/aquatone_linux_amd64_1.7.0.zip|Visual inspection of websites across hosts"
-    TOOL_INSTALL_INFO["subjack"]="go_install|github.com/haccer/subjack|Subdomain takeover vulnerability checker"
-    TOOL_INSTALL_INFO["dnsenum"]="pkg_manager|dnsenum|DNS enumeration script"
-    
-    # Additional tools mentioned in the server code but not explicitly in README categories
-    TOOL_INSTALL_INFO["theharvester"]="pkg_manager|theharvester|Email/subdomain harvester"
-    TOOL_INSTALL_INFO["responder"]="pkg_manager|responder|LLMNR/NBT-NS/MDNS poisoner"
-    TOOL_INSTALL_INFO["netexec"]="pip_install|netexec|Network service exploitation tool"
-    TOOL_INSTALL_INFO["enum4linux-ng"]="github_manual|https://github.com/cddmp/enum4linux-ng|Next-generation enum4linux"
-    TOOL_INSTALL_INFO["dirsearch"]="github_manual|https://github.com/maurosoria/dirsearch|Web path discovery tool"
-    TOOL_INSTALL_INFO["katana"]="go_install|github.com/projectdiscovery/katana/cmd/katana|Web crawler"
-    TOOL_INSTALL_INFO["dalfox"]="go_install|github.com/hahwul/dalfox/v2|XSS scanner and utility"
-    
-    # Tools from the MCP code analysis
-    TOOL_INSTALL_INFO["smbmap"]="pip_install|smbmap|SMB share enumeration tool"
-    TOOL_INSTALL_INFO["msfvenom"]="pkg_manager|metasploit-framework|Metasploit payload generator"
-    TOOL_INSTALL_INFO["msfconsole"]="pkg_manager|metasploit-framework|Metasploit console"
-    TOOL_INSTALL_INFO["hash-identifier"]="pkg_manager|hash-identifier|Hash type identifier"
-    TOOL_INSTALL_INFO["ophcrack"]="pkg_manager|ophcrack|Windows password cracker"
-    TOOL_INSTALL_INFO["rustscan"]="github_release|https://github.com/bee-san/RustScan/releases/download/2.3.0/rustscan_2.3.0_amd64.deb|Ultra-fast port scanner"
-}
-
-# Function to get package name based on distribution
-get_package_name() {
-    local tool=$1
-    
-    case $DISTRO in
-        "ubuntu"|"debian"|"kali"|"parrot"|"mint")
-            case $tool in
-                "theharvester") echo "theharvester" ;;
-                "evil-winrm") echo "evil-winrm" ;;
-                "hash-identifier") echo "hash-identifier" ;;
-                "enum4linux-ng") echo "enum4linux-ng" ;;
-                "httpx") echo "httpx-toolkit" ;;
-                "volatility3") echo "volatility3" ;;
-                "netexec") echo "netexec" ;;
-                "exiftool") echo "libimage-exiftool-perl" ;;
-                "zaproxy") echo "zaproxy" ;;
-                "sleuthkit") echo "sleuthkit" ;;
-                "metasploit-framework") echo "metasploit-framework" ;;
-                "xxd") echo "xxd" ;;
-                *) echo "$tool" ;;
-            esac
-            ;;
-        "fedora"|"rhel"|"centos")
-            case $tool in
-                "theharvester") echo "theHarvester" ;;
-                "evil-winrm") echo "rubygem-evil-winrm" ;;
-                "enum4linux-ng") echo "enum4linux-ng" ;;
-                "httpx") echo "httpx" ;;
-                "volatility3") echo "python3-volatility3" ;;
-                "exiftool") echo "perl-Image-ExifTool" ;;
-                "zaproxy") echo "zaproxy" ;;
-                "sleuthkit") echo "sleuthkit" ;;
-                "metasploit-framework") echo "metasploit" ;;
-                "xxd") echo "vim-common" ;;
-                *) echo "$tool" ;;
-            esac
-            ;;
-        "arch"|"manjaro"|"endeavouros")
-            case $tool in
-                "theharvester") echo "theharvester" ;;
-                "evil-winrm") echo "evil-winrm" ;;
-                "hash-identifier") echo "hash-identifier" ;;
-                "enum4linux-ng") echo "enum4linux-ng" ;;
-                "httpx") echo "httpx" ;;
-                "volatility3") echo "volatility3" ;;
-                "exiftool") echo "perl-image-exiftool" ;;
-                "zaproxy") echo "zaproxy" ;;
-                "sleuthkit") echo "sleuthkit" ;;
-                "metasploit-framework") echo "metasploit" ;;
-                "xxd") echo "xxd" ;;
-                *) echo "$tool" ;;
-            esac
-            ;;
-        *)
-            echo "$tool"
-            ;;
-    esac
-}
+    return choice == 'y'
 
-# Function to check if a command exists
-check_tool() {
-    local tool=$1
-    local alt_check=$2
-    
-    TOTAL_COUNT=$((TOTAL_COUNT + 1))
-    
-    # Check primary command
-    if command -v "$tool" > /dev/null 2>&1; then
-        echo -e "✅ ${GREEN}$tool${NC} - ${GREEN}INSTALLED${NC}"
-        INSTALLED_TOOLS+=("$tool")
-        INSTALLED_COUNT=$((INSTALLED_COUNT + 1))
-        return 0
-    fi
-    
-    # Check alternative command if provided
-    if [ -n "$alt_check" ] && command -v "$alt_check" > /dev/null 2>&1; then
-        echo -e "✅ ${GREEN}$tool${NC} (as $alt_check) - ${GREEN}INSTALLED${NC}"
-        INSTALLED_TOOLS+=("$tool")
-        INSTALLED_COUNT=$((INSTALLED_COUNT + 1))
-        return 0
-    fi
-    
-    # Check if it's a Python package that might be installed
-    if python3 -c "import $tool" > /dev/null 2>&1; then
-        echo -e "✅ ${GREEN}$tool${NC} (Python package) - ${GREEN}INSTALLED${NC}"
-        INSTALLED_TOOLS+=("$tool")
-        INSTALLED_COUNT=$((INSTALLED_COUNT + 1))
-        return 0
-    fi
-    
-    # Check common installation locations
-    local locations=(
-        "/usr/bin/$tool"
-        "/usr/local/bin/$tool"
-        "/opt/$tool"
-        "/home/$USER/tools/$tool"
-        "/home/$USER/Desktop/$tool"
-        "/usr/share/$tool"
-        "/snap/bin/$tool"
-        "/usr/local/share/$tool"
-    )
-    
-    for location in "${locations[@]}"; do
-        if [ -f "$location" ] || [ -d "$location" ]; then
-            echo -e "✅ ${GREEN}$tool${NC} - ${GREEN}INSTALLED${NC} (found at $location)"
-            INSTALLED_TOOLS+=("$tool")
-            INSTALLED_COUNT=$((INSTALLED_COUNT + 1))
-            return 0
-        fi
-    done
-    
-    # Tool not found
-    local package_name=$(get_package_name "$tool")
-    echo -e "❌ ${RED}$tool${NC} - ${RED}NOT INSTALLED${NC} ${YELLOW}($PKG_MANAGER install $package_name)${NC}"
-    MISSING_TOOLS+=("$tool:$package_name")
-    MISSING_COUNT=$((MISSING_COUNT + 1))
-    return 1
-}
+def install_system_tools(refresh=False):
+    _say(f"    {CYAN}Running tool verification and installation script...{RESET}")
+    try:
+        run_streaming(["bash", str(TOOLS_SCRIPT)] + (["--refresh"] if refresh else []))
+        ok("Tool verification script finished.")
+    except Exception as e:
+        err(f"Tool script failed: {e}")
 
-# Function to validate and generate installation commands
-generate_verified_install_commands() {
-    if [ $MISSING_COUNT -eq 0 ]; then
+def _missing(packages):
+    """Distributions in *packages* that are not installed in this interpreter."""
+    from importlib.metadata import version, PackageNotFoundError
+    missing = []
+    for pkg in packages:
+        try:
+            version(pkg)
+        except PackageNotFoundError:
+            missing.append(pkg)
+    return missing
+
+def _installer_cmd():
+    """uv's parallel resolver/downloader when on PATH, else this interpreter's pip."""
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "pip", "install", "--python", sys.executable]
+    return [sys.executable, "-m", "pip", "install", "--no-input", "--disable-pip-version-check",
+            "--cache-dir", str(PIP_CACHE)]
+
+def install_deps(upgrade=False):
+    header("Step 1: Install Dependencies")
+    # Only what is missing, unless upgrading: a re-run then costs no pip resolver pass at all
+    todo = REQUIREMENTS if upgrade else _missing(REQUIREMENTS)
+    if not todo:
+        ok("All dependencies already installed (use --upgrade to refresh).")
         return
-    fi
-    
-    echo -e "${YELLOW}📦 HEXSTRIKE AI OFFICIAL INSTALLATION COMMANDS:${NC}"
-    echo "================================================"
-    
-    local PKG_MANAGER_TOOLS=""
-    local GO_TOOLS=""
-    local PIP_TOOLS=""
-    local GITHUB_RELEASES=""
-    local MANUAL_INSTALLS=""
-    local FAILED_VERIFICATIONS=""
-    
-    for missing in "${MISSING_TOOLS[@]}"; do
-        local tool=$(echo "$missing" | cut -d':' -f1)
-        local package=$(echo "$missing" | cut -d':' -f2)
-        
-        if [ -n "${TOOL_INSTALL_INFO[$tool]}" ]; then
-            IFS='|' read -r install_type install_info description <<< "${TOOL_INSTALL_INFO[$tool]}"
-            
-            case $install_type in
-                "pkg_manager")
-                    PKG_MANAGER_TOOLS+=" $package"
-                    ;;
-                
-                "go_install")
-                    echo -e "${BLUE}🔍 Verifying Go package: $install_info${NC}"
-                    if check_url "https://$install_info"; then
-                        GO_TOOLS+="
-  go install -v $install_info@latest"
-                        echo -e "  ✅ ${GREEN}Verified${NC}"
-                    else
-                        GO_TOOLS+="
-  go install -v $install_info@latest  # ⚠️  Could not verify"
-                        echo -e "  ⚠️  ${YELLOW}Could not verify URL${NC}"
-                    fi
-                    ;;
-                
-                "pip_install")
-                    PIP_TOOLS+="
-  pip3 install $install_info"
-                    ;;
-                
-                "github_release")
-                    echo -e "${BLUE}🔍 Verifying GitHub release: $install_info${NC}"
-                    if check_url "$install_info"; then
-                        GITHUB_RELEASES+="
-# $tool - $description
-wget $install_info
-"
-                        echo -e "  ✅ ${GREEN}Download link verified${NC}"
-                    else
-                        # Try to find working alternative
-                        local base_url=$(echo "$install_info" | sed 's|/releases/latest/download/.*|/releases|')
-                        GITHUB_RELEASES+="
-# $tool - $description
-# ⚠️  Direct link failed, visit: $base_url
-"
-                        FAILED_VERIFICATIONS+="
-❌ $tool: $install_info"
-                        echo -e "  ❌ ${RED}Download link failed - check manually${NC}"
-                    fi
-                    ;;
-                
-                "github_manual")
-                    echo -e "${BLUE}🔍 Verifying GitHub repo: $install_info${NC}"
-                    if check_url "$install_info"; then
-                        MANUAL_INSTALLS+="
-# $tool - $description
-git clone $install_info
-cd $(basename $install_info)
-# Follow installation instructions in README
-"
-                        echo -e "  ✅ ${GREEN}Repository verified${NC}"
-                    else
-                        MANUAL_INSTALLS+="
-# $tool - $description
-# ⚠️  Repository URL failed: $install_info
-"
-                        FAILED_VERIFICATIONS+="
-❌ $tool: $install_info"
-                        echo -e "  ❌ ${RED}Repository not accessible${NC}"
-                    fi
-                    ;;
-                
-                "manual_download")
-                    echo -e "${BLUE}🔍 Verifying manual download: $install_info${NC}"
-                    if check_url "$install_info"; then
-                        MANUAL_INSTALLS+="
-# $tool - $description
-# Download from: $install_info
-# Extract and follow installation instructions
-"
-                        echo -e "  ✅ ${GREEN}Download page verified${NC}"
-                    else
-                        MANUAL_INSTALLS+="
-# $tool - $description
-# ⚠️  Download page failed: $install_info
-"
-                        FAILED_VERIFICATIONS+="
-❌ $tool: $install_info"
-                        echo -e "  ❌ ${RED}Download page not accessible${NC}"
-                    fi
-                    ;;
-            esac
-        else
-            PKG_MANAGER_TOOLS+=" $package"
-        fi
-    done
-    
-    echo ""
-    
-    # Display installation commands
-    if [ -n "$PKG_MANAGER_TOOLS" ]; then
-        echo -e "${CYAN}📦 Package Manager Installation ($PKG_MANAGER):${NC}"
-        echo "$INSTALL_CMD$PKG_MANAGER_TOOLS"
-        echo ""
-    fi
-    
-    if [ -n "$PIP_TOOLS" ]; then
-        echo -e "${CYAN}🐍 Python Package Installation:${NC}"
-        echo -e "$PIP_TOOLS"
-        echo ""
-    fi
-    
-    if [ -n "$GO_TOOLS" ]; then
-        echo -e "${CYAN}🐹 Go Package Installation (requires Go):${NC}"
-        echo "# First install Go if not present:"
-        case $DISTRO in
-            "ubuntu"|"debian"|"kali"|"parrot"|"mint")
-                echo "sudo apt install golang-go"
-                ;;
-            "fedora"|"rhel"|"centos")
-                echo "sudo $PKG_MANAGER install go"
-                ;;
-            "arch"|"manjaro"|"endeavouros")
-                echo "sudo pacman -S go"
-                ;;
-        esac
-        echo -e "$GO_TOOLS"
-        echo ""
-    fi
-    
-    if [ -n "$GITHUB_RELEASES" ]; then
-        echo -e "${CYAN}📁 GitHub Releases (Verified Links):${NC}"
-        echo -e "$GITHUB_RELEASES"
-        echo ""
-    fi
-    
-    if [ -n "$MANUAL_INSTALLS" ]; then
-        echo -e "${CYAN}🔧 Manual Installations:${NC}"
-        echo -e "$MANUAL_INSTALLS"
-        echo ""
-    fi
-    
-    if [ -n "$FAILED_VERIFICATIONS" ]; then
-        echo -e "${RED}⚠️  Failed Link Verifications:${NC}"
-        echo -e "$FAILED_VERIFICATIONS"
-        echo -e "
-${YELLOW}💡 For failed links, please check the official project repositories manually.${NC}"
-        echo ""
-    fi
-    
-    # HexStrike AI Official Installation Commands
-    echo -e "${GREEN}🚀 HEXSTRIKE AI MEGA INSTALLATION COMMAND:${NC}"
-    case $DISTRO in
-        "ubuntu"|"debian"|"kali"|"parrot"|"mint")
-            echo "# Network & Recon tools"
-            echo "sudo apt update && sudo apt install -y nmap masscan amass fierce dnsenum theharvester responder"
-            echo ""
-            echo "# Web Application Security tools"
-            echo "sudo apt install -y gobuster ffuf dirb nikto sqlmap wpscan wafw00f zaproxy xsser wfuzz"
-            echo ""
-            echo "# Password & Authentication tools"  
-            echo "sudo apt install -y hydra john hashcat medusa patator evil-winrm hash-identifier ophcrack"
-            echo ""
-            echo "# Binary Analysis & Reverse Engineering tools"
-            echo "sudo apt install -y gdb radare2 binwalk checksec binutils foremost steghide libimage-exiftool-perl sleuthkit xxd metasploit-framework"
-            echo ""
-            echo "# Python packages"
-            echo "pip3 install autorecon ropgadget arjun crackmapexec netexec volatility3 prowler-cloud scoutsuite kube-hunter smbmap"
-            echo ""
-            echo "# Go packages (requires Go)"
-            echo "go install github.com/owasp-amass/amass/v4/cmd/amass@latest"
-            echo "go install github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest"
-            echo "go install github.com/projectdiscovery/nuclei/v3/cmd/nuclei@latest"
-           echo "go install github.com/projectdiscovery/httpx/cmd/httpx@latest"
-           echo "go install github.com/projectdiscovery/katana/cmd/katana@latest"
-           echo "go install github.com/hahwul/dalfox/v2@latest"
-           echo "go install github.com/hakluke/hakrawler@latest"
-           echo "go install github.com/haccer/subjack@latest"
-           ;;
-       "fedora"|"rhel"|"centos")
-           echo "# Network & Recon tools"
-           echo "sudo $PKG_MANAGER install -y nmap masscan dnsenum theHarvester"
-           echo ""
-           echo "# Web Application Security tools"
-           echo "sudo $PKG_MANAGER install -y gobuster ffuf dirb nikto sqlmap zaproxy wfuzz"
-           echo ""
-           echo "# Password & Authentication tools"
-           echo "sudo $PKG_MANAGER install -y hydra john hashcat medusa patator rubygem-evil-winrm ophcrack"
-           echo ""
-           echo "# Binary Analysis & Reverse Engineering tools"
-           echo "sudo $PKG_MANAGER install -y gdb radare2 binwalk binutils foremost steghide perl-Image-ExifTool sleuthkit vim-common"
-           echo ""
-           echo "# Python packages"
-           echo "pip3 install autorecon ropgadget arjun crackmapexec netexec volatility3 prowler-cloud scoutsuite kube-hunter smbmap"
-           ;;
-       "arch"|"manjaro"|"endeavouros")
-           echo "# Network & Recon tools"
-           echo "sudo pacman -S nmap masscan dnsenum theharvester"
-           echo ""
-           echo "# Web Application Security tools"
-           echo "sudo pacman -S gobuster ffuf dirb nikto sqlmap zaproxy wfuzz"
-           echo ""
-           echo "# Password & Authentication tools"
-           echo "sudo pacman -S hydra john hashcat medusa patator evil-winrm hash-identifier ophcrack"
-           echo ""
-           echo "# Binary Analysis & Reverse Engineering tools"
-           echo "sudo pacman -S gdb radare2 binwalk binutils foremost steghide perl-image-exiftool sleuthkit xxd metasploit"
-           echo ""
-           echo "# Python packages"
-           echo "pip3 install autorecon ropgadget arjun crackmapexec netexec volatility3 prowler-cloud scoutsuite kube-hunter smbmap"
-           ;;
-   esac
-   echo ""
-}
-
-# Main execution
-echo -e "${ORANGE}🔍 Initializing complete HexStrike AI tool database...${NC}"
-init_complete_tool_database
-
-detect_distro
-get_package_manager
-
-if [ "$CURL_AVAILABLE" = false ]; then
-   echo -e "${YELLOW}⚠️  curl not found. Link verification disabled. Install curl for full functionality.${NC}"
-   echo ""
-fi
-
-echo -e "${MAGENTA}🔍 Network Reconnaissance & Scanning Tools${NC}"
-echo "================================================"
-check_tool "nmap"
-check_tool "amass"
-check_tool "subfinder"
-check_tool "nuclei"
-check_tool "autorecon"
-check_tool "fierce"
-check_tool "masscan"
-check_tool "theharvester"
-check_tool "responder"
-check_tool "netexec" "nxc"
-check_tool "enum4linux-ng"
-check_tool "dnsenum"
-check_tool "rustscan"
-echo ""
-
-echo -e "${MAGENTA}🌐 Web Application Security Testing Tools${NC}"
-echo "================================================"
-check_tool "gobuster"
-check_tool "ffuf"
-check_tool "dirb"
-check_tool "nikto"
-check_tool "sqlmap"
-check_tool "wpscan"
-check_tool "burpsuite"
-check_tool "zaproxy" "zap"
-check_tool "arjun"
-check_tool "wafw00f"
-check_tool "feroxbuster"
-check_tool "dotdotpwn"
-check_tool "xsser"
-check_tool "wfuzz"
-check_tool "dirsearch"
-check_tool "katana"
-check_tool "dalfox"
-check_tool "httpx"
-check_tool "paramspider"
-echo ""
-
-echo -e "${MAGENTA}🔐 Authentication & Password Security Tools${NC}"
-echo "================================================"
-check_tool "hydra"
-check_tool "john"
-check_tool "hashcat"
-check_tool "medusa"
-check_tool "patator"
-check_tool "crackmapexec" "cme"
-check_tool "evil-winrm"
-check_tool "hash-identifier"
-check_tool "ophcrack"
-echo ""
-
-echo -e "${MAGENTA}🔬 Binary Analysis & Reverse Engineering Tools${NC}"
-echo "================================================"
-check_tool "gdb"
-check_tool "radare2" "r2"
-check_tool "binwalk"
-check_tool "ropgadget"
-check_tool "checksec"
-check_tool "strings"
-check_tool "objdump"
-check_tool "ghidra"
-check_tool "xxd"
-check_tool "msfvenom"
-check_tool "msfconsole"
-check_tool "smbmap"
-echo ""
-
-echo -e "${MAGENTA}🏆 Advanced CTF & Forensics Tools${NC}"
-echo "================================================"
-check_tool "volatility3" "vol3"
-check_tool "foremost"
-check_tool "steghide"
-check_tool "exiftool"
-check_tool "hashpump"
-check_tool "autopsy"
-check_tool "sleuthkit"
-echo ""
-
-echo -e "${MAGENTA}☁️ Cloud & Container Security Tools${NC}"
-echo "================================================"
-check_tool "prowler"
-check_tool "trivy"
-check_tool "scout-suite"
-check_tool "kube-hunter"
-check_tool "kube-bench"
-check_tool "cloudsploit"
-echo ""
-
-echo -e "${MAGENTA}🔥 Bug Bounty & Reconnaissance Arsenal${NC}"
-echo "================================================"
-check_tool "hakrawler"
-check_tool "httpx"
-check_tool "paramspider"
-check_tool "aquatone"
-check_tool "subjack"
-echo ""
-
-# Summary
-echo "================================================"
-echo -e "${WHITE}📊 HEXSTRIKE AI INSTALLATION SUMMARY${NC}"
-echo "================================================"
-echo -e "✅ ${GREEN}Installed tools: $INSTALLED_COUNT/$TOTAL_COUNT${NC}"
-echo -e "❌ ${RED}Missing tools: $MISSING_COUNT/$TOTAL_COUNT${NC}"
-
-# HexStrike AI specific recommendations
-echo ""
-echo -e "${CYAN}📋 HEXSTRIKE AI OFFICIAL REQUIREMENTS:${NC}"
-echo "================================================"
-
-# Essential tools (based on README)
-ESSENTIAL_TOOLS=("nmap" "nuclei" "gobuster" "ffuf" "sqlmap" "hydra" "gdb" "radare2")
-ESSENTIAL_MISSING=0
-ESSENTIAL_TOTAL=${#ESSENTIAL_TOOLS[@]}
-
-echo -e "${YELLOW}🔥 Essential Tools Status:${NC}"
-for tool in "${ESSENTIAL_TOOLS[@]}"; do
-   if command -v "$tool" > /dev/null 2>&1; then
-       echo -e "  ✅ ${GREEN}$tool${NC}"
-   else
-       echo -e "  ❌ ${RED}$tool${NC} - CRITICAL"
-       ESSENTIAL_MISSING=$((ESSENTIAL_MISSING + 1))
-   fi
-done
-
-echo ""
-if [ $ESSENTIAL_MISSING -eq 0 ]; then
-   echo -e "🎉 ${GREEN}All essential HexStrike AI tools are installed!${NC}"
-else
-   echo -e "⚠️  ${RED}$ESSENTIAL_MISSING/$ESSENTIAL_TOTAL essential tools missing. HexStrike AI functionality will be limited.${NC}"
-fi
-
-echo ""
-echo -e "${BLUE}🤖 AI Agent Compatibility Status:${NC}"
-if [ $MISSING_COUNT -eq 0 ]; then
-   echo -e "✅ ${GREEN}Perfect! All 70+ tools ready for AI agent automation${NC}"
-elif [ $MISSING_COUNT -le 10 ]; then
-   echo -e "👍 ${YELLOW}Good! Most tools available - AI agents can perform comprehensive assessments${NC}"
-elif [ $MISSING_COUNT -le 20 ]; then
-   echo -e "⚠️  ${ORANGE}Moderate! Some limitations expected in AI agent capabilities${NC}"
-else
-   echo -e "❌ ${RED}Significant gaps! AI agents will have limited cybersecurity capabilities${NC}"
-fi
-
-if [ $MISSING_COUNT -gt 0 ]; then
-   echo ""
-   generate_verified_install_commands
-fi
-
-# Performance indicator with HexStrike AI context
-PERCENTAGE=$(( (INSTALLED_COUNT * 100) / TOTAL_COUNT ))
-echo ""
-echo -e "${WHITE}📈 HEXSTRIKE AI READINESS SCORE: $PERCENTAGE%${NC}"
-
-if [ $PERCENTAGE -ge 90 ]; then
-   echo -e "🔥 ${GREEN}ELITE SETUP! Your AI agents are ready for advanced autonomous pentesting!${NC}"
-   echo -e "${GREEN}✅ Full HexStrike AI capabilities unlocked${NC}"
-elif [ $PERCENTAGE -ge 80 ]; then
-   echo -e "🚀 ${GREEN}EXCELLENT! AI agents can perform comprehensive security assessments${NC}"
-   echo -e "${GREEN}✅ Most HexStrike AI features available${NC}"
-elif [ $PERCENTAGE -ge 70 ]; then
-   echo -e "👍 ${YELLOW}GOOD! AI agents have solid cybersecurity capabilities${NC}"
-   echo -e "${YELLOW}⚠️  Some advanced features may be limited${NC}"
-elif [ $PERCENTAGE -ge 50 ]; then
-   echo -e "⚠️  ${ORANGE}MODERATE! Basic AI agent security testing possible${NC}"
-   echo -e "${ORANGE}❌ Advanced HexStrike AI features unavailable${NC}"
-else
-   echo -e "❌ ${RED}INSUFFICIENT! Major limitations in AI agent capabilities${NC}"
-   echo -e "${RED}🔧 Install more tools for meaningful HexStrike AI functionality${NC}"
-fi
-
-echo ""
-echo -e "${BLUE}💡 NEXT STEPS FOR HEXSTRIKE AI:${NC}"
-echo "1. Install missing tools using the commands above"
-echo "2. Clone HexStrike AI: git clone https://github.com/0x4m4/hexstrike-ai.git"
-echo "3. Install Python dependencies: pip3 install -r requirements.txt"
-echo "4. Start the server: python3 hexstrike_server.py"
-echo "5. Configure your AI agent with the MCP client"
-echo ""
-echo -e "${CYAN}🌐 Official HexStrike AI Resources:${NC}"
-echo "📖 Documentation: https://github.com/0x4m4/hexstrike-ai/blob/master/README.md"
-echo "🔗 Project Page: https://www.hexstrike.com"
-echo "👨‍💻 Author: 0x4m4 (https://www.0x4m4.com)"
-echo ""
-echo -e "${WHITE}🤖 Ready to empower your AI agents with autonomous cybersecurity capabilities!${NC}"
-echo """""
-        script_path = "/tmp/hexstrike_install_tools.sh"
+    if LOCK_FILE.exists():
+        _say(f"Installing pinned set from {LOCK_FILE.name}...")
         try:
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(script_content)
-            os.chmod(script_path, 0o755)
-            subprocess.check_call(["bash", script_path])
-            ok("Tool verification script finished.")
+            # Every transitive pin is in the lock: pure download, no resolver
+            run_streaming(_installer_cmd() + ["--no-deps", "--require-hashes", "-r", str(LOCK_FILE)])
+            ok("All dependencies installed.")
         except Exception as e:
-            err(f"Tool script failed: {e}")
-        finally:
-            if os.path.exists(script_path):
-                os.remove(script_path)
-
-def install_deps():
-    header("Step 1: Install Dependencies")
-    print(f"Installing: {', '.join(REQUIREMENTS)}...")
+            err(f"Dependency install failed: {e}")
+        return
+    _say(f"Installing: {', '.join(todo)}...")
+    cmd = _installer_cmd() + ["--upgrade"]
+    uv = cmd[0] != sys.executable
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade"] + REQUIREMENTS)
+        # pip only: current pip/wheel first, so any sdist below is built once and cached as a wheel
+        if not uv and (upgrade or _missing(["wheel"])):
+            run_streaming(cmd + ["pip", "wheel", "setuptools"])
+        # uv already prefers wheels and keeps its own global cache
+        prefer = [] if uv else ["--prefer-binary"]
+        run_streaming(cmd + prefer + ["--only-binary", ",".join(BINARY_ONLY)] + todo)
         ok("All dependencies installed.")
     except Exception as e:
         err(f"Dependency install failed: {e}")
@@ -889,28 +181,71 @@ def setup_env():
         "REDIS_URL": "redis://localhost:6379/0"
     }
 
-    with open(ENV_FILE, "w") as f:
-        for k, v in config.items():
-            f.write(f"{k}={v}\n")
+    # One write, and owner-only from creation: the file holds API keys and passwords
+    body = "".join(f"{k}={v}\n" for k, v in config.items()).encode()
+    fd = os.open(ENV_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, body)
+    finally:
+        os.close(fd)
     ok(".env file created.")
 
-    # Clone Awesome Skills
+def _fetch_skills_tarball(skills_dir):
+    """Stream the default branch's tarball into *skills_dir*: one GET, no git."""
+    import tarfile
+    import urllib.request
+    # The "data" filter (3.12, and late 3.8-3.11 patch releases) keeps every
+    # member inside the target; without it, leave this to the git fallback
+    if not hasattr(tarfile, "data_filter"):
+        raise RuntimeError("this Python's tarfile cannot sanitise member paths")
+    part = skills_dir.with_name(skills_dir.name + ".part")
+    shutil.rmtree(part, ignore_errors=True)
+    try:
+        with urllib.request.urlopen(f"https://api.github.com/repos/{SKILLS_REPO}/tarball", timeout=30) as resp, \
+                tarfile.open(fileobj=resp, mode="r|gz") as tar:
+            for member in tar:
+                # Drop the "<owner>-<repo>-<sha>/" top-level directory
+                top, _, member.name = member.name.partition("/")
+                if not member.name:
+                    continue
+                # Hardlink targets are archive paths too, so they lose the same prefix
+                if member.islnk():
+                    if not member.linkname.startswith(top + "/"):
+                        raise tarfile.FilterError(f"hardlink outside the archive root: {member.name}")
+                    member.linkname = member.linkname[len(top) + 1:]
+                tar.extract(member, part, filter="data")
+        part.rename(skills_dir)
+    finally:
+        shutil.rmtree(part, ignore_errors=True)
+
+def clone_awesome_skills():
     header("Step 2.5: Downloading Awesome Agentic Skills")
     skills_dir = ROOT / ".agent" / "skills"
     if skills_dir.exists():
         ok("Awesome Skills repository already exists. Skipping clone.")
-    else:
-        try:
-            print(f"    {CYAN}Cloning sickn33/antigravity-awesome-skills...{RESET}")
-            subprocess.check_call(
-                ["git", "clone", "https://github.com/sickn33/antigravity-awesome-skills.git", str(skills_dir)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            ok("Awesome Skills downloaded successfully.")
-        except Exception as e:
-            warn(f"Failed to clone Awesome Skills: {e}")
-            print(f"    {YELLOW}You can manually clone it later to {skills_dir}{RESET}")
+        return
+    _say(f"    {CYAN}Downloading {SKILLS_REPO}...{RESET}")
+    try:
+        _fetch_skills_tarball(skills_dir)
+        ok("Awesome Skills downloaded successfully.")
+        return
+    except Exception as e:
+        warn(f"Tarball download failed ({e}); falling back to git clone.")
+    try:
+        # Read-only data: the tip of the default branch is all that is needed.
+        # No prompt either, so a moved or private repo fails instead of hanging
+        subprocess.check_call(
+            ["git", "clone", "--depth=1", "--single-branch", "--no-tags",
+             f"https://github.com/{SKILLS_REPO}.git", str(skills_dir)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            close_fds=False
+        )
+        ok("Awesome Skills downloaded successfully.")
+    except Exception as e:
+        warn(f"Failed to clone Awesome Skills: {e}")
+        _say(f"    {YELLOW}You can manually clone it later to {skills_dir}{RESET}")
 
 def setup_services():
     header("Step 3: Service Registration")
@@ -931,26 +266,69 @@ def setup_services():
             [Install]
             WantedBy=multi-user.target
         """)
+        unit = ROOT / "hexclaw.service"
         try:
+            # Unchanged unit: no write, and nothing to copy or daemon-reload again
+            if unit.exists() and unit.read_text() == content:
+                ok(f"systemd unit at {unit} is up to date.")
+                return
             # Note: This usually requires sudo to write to /etc
-            with open(ROOT / "hexclaw.service", "w") as f:
-                f.write(content)
-            ok(f"systemd unit written to {ROOT}/hexclaw.service (copy to /etc/systemd/system/)")
+            tmp = unit.with_name(unit.name + ".tmp")
+            tmp.write_text(content, newline="\n")
+            os.replace(tmp, unit)
+            ok(f"systemd unit written to {unit} (copy to /etc/systemd/system/)")
         except Exception as e:
             warn(f"Could not write service file: {e}")
     else:
         ok("Windows detected: Please use NSSM or Task Scheduler to run daemon.py.")
 
+def _redis_reachable():
+    """PING the Redis at REDIS_URL (a bare TCP connect if redis-py isn't installed yet)."""
+    url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    try:
+        import redis
+        return bool(redis.Redis.from_url(url, socket_connect_timeout=0.5, socket_timeout=0.5).ping())
+    except ImportError:
+        import socket
+        from urllib.parse import urlparse
+        parsed = urlparse(url)
+        try:
+            socket.create_connection((parsed.hostname or "localhost", parsed.port or 6379), timeout=0.5).close()
+            return True
+        except OSError:
+            return False
+    except Exception:
+        return False
+
+@lru_cache(maxsize=None)
+def _path_commands():
+    """Every file name on PATH, from one directory listing per PATH entry."""
+    names = set()
+    for d in os.get_exec_path():
+        try:
+            with os.scandir(d) as it:
+                entries = [e.name for e in it]
+        except OSError:
+            continue
+        names.update(entries)
+        if os.name == "nt":  # redis-cli.exe answers to "redis-cli"
+            names.update(os.path.splitext(n)[0].lower() for n in entries)
+    return frozenset(names)
+
 def check_infra():
     header("Step 4: Infrastructure Check")
-    if shutil.which("redis-cli"): ok("Redis detected.")
+    # Probe the server itself: also finds a Dockerised Redis with no redis-cli on PATH
+    if _redis_reachable(): ok("Redis detected.")
+    elif "redis-cli" in _path_commands(): warn("Redis installed but not answering at REDIS_URL.")
     else: warn("Redis not found in PATH.")
-    if shutil.which("psql"): ok("PostgreSQL detected.")
+    if "psql" in _path_commands(): ok("PostgreSQL detected.")
     else: warn("PostgreSQL not found in PATH.")
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--upgrade", action="store_true", help="reinstall/upgrade all pip dependencies")
+    parser.add_argument("--refresh", action="store_true", help="re-verify tool download links, ignoring the cache")
     args = parser.parse_args()
 
     print(f"\n{BOLD}{CYAN}# HexClaw Orchestrator Installation{RESET}")
@@ -963,9 +341,18 @@ def main():
         ok("Services would be registered.")
         return
 
-    install_system_tools()
-    install_deps()
-    setup_env()
+    # The tool script prompt decides what to start; everything else starts now
+    system_tools = want_system_tools()
+    # Tool script, pip and clone are disjoint and network-bound: run them side by side,
+    # and behind the .env prompts, whose answers none of them need
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        steps = [pool.submit(install_deps, upgrade=args.upgrade), pool.submit(clone_awesome_skills)]
+        if system_tools:
+            steps.append(pool.submit(install_system_tools, refresh=args.refresh))
+        with _prompting():
+            setup_env()
+        for step in steps:
+            step.result()
     check_infra()
     setup_services()
     header("Setup Complete")
@@ -38,10 +38,6 @@ import sys
 from datetime import datetime, timezone
 from typing import Any
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 log = logging.getLogger("hexclaw.monitor")
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -272,28 +268,48 @@ class DedupeStore:
 # Postgres writer
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _pg_write_alert(alert: Alert) -> int:
-    """Write alert to Postgres alerts table. Returns alert ID or -1."""
+# One connection for the monitor's lifetime: a connect (TCP + auth) per alert
+# cost more than the INSERT itself. Dropped and reopened after any failure.
+_pg_conn: Any = None
+
+
+def _pg_connection() -> Any:
+    global _pg_conn
+    if _pg_conn is None or _pg_conn.closed:
+        import psycopg2  # type: ignore
+        _pg_conn = psycopg2.connect(POSTGRES_DSN)
+        _pg_conn.autocommit = True
+    return _pg_conn
+
+
+def _pg_write_alerts(alerts: list[Alert]) -> int:
+    """
+    Write a poll pass's alerts to the Postgres alerts table in one
+    multi-row INSERT (execute_values). Returns rows written, or -1.
+    """
+    global _pg_conn
+    if not alerts:
+        return 0
     if not POSTGRES_DSN:
         return -1
     try:
-        import psycopg2  # type: ignore
-        conn = psycopg2.connect(POSTGRES_DSN)
-        conn.autocommit = True
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO alerts (source, title, url, severity)
-                VALUES (%s, %s, %s, %s)
-                RETURNING id
-                """,
-                (alert.source, alert.title, alert.url, alert.severity),
+        from psycopg2.extras import execute_values  # type: ignore
+        with _pg_connection().cursor() as cur:
+            execute_values(
+                cur,
+                "INSERT INTO alerts (source, title, url, severity) VALUES %s",
+                [(a.source, a.title, a.url, a.severity) for a in alerts],
+                page_size=1000,
             )
-            aid = cur.fetchone()[0]
-        conn.close()
-        return aid
+        return len(alerts)
     except Exception as exc:
-        log.debug("pg_write_alert failed: %s", exc)
+        log.debug("pg_write_alerts failed: %s", exc)
+        if _pg_conn is not None:
+            try:
+                _pg_conn.close()
+            except Exception:
+                pass
+            _pg_conn = None
         return -1
 
 
@@ -558,6 +574,10 @@ class Monitor:
             if action == "sent":
                 sent.append(alert)
 
+        # One round trip for the whole pass instead of an INSERT per alert
+        if sent and not self._dry_run:
+            _pg_write_alerts(sent)
+
         log.info(
             "Monitor pass complete: %d total, %d sent, %d dedup-skipped, %d below-threshold",
             len(all_alerts),
@@ -602,7 +622,6 @@ class Monitor:
         # 4. Send Telegram notification
         if not self._dry_run:
             await self._send_telegram(alert, ai_summary)
-            _pg_write_alert(alert)
         else:
             log.info("[DRY RUN] Would send alert: [%s] %s", alert.severity, alert.title)
 
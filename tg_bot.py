@@ -31,8 +31,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
-from dotenv import load_dotenv
-
 # ── Optional runtime imports (graceful if deps not yet installed) ─────────────
 try:
     from telegram import (
@@ -60,8 +58,6 @@ except ImportError:
     CommandHandler = None
     ContextTypes = None
 
-load_dotenv()
-
 log = logging.getLogger("hexclaw.tg_bot")
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -260,7 +256,7 @@ async def cmd_orchestrate(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     plan_text += f"📦 *Parameters:*\n```yaml\n{yaml.dump(params)}```\n"
     
     # Add data-driven suggestions
-    suggestions = data.suggest_next(skill)
+    suggestions = await data.asuggest_next(skill)
     if suggestions:
         plan_text += "💡 *Suggestions:* " + ", ".join(suggestions) + "\n\n"
         
@@ -448,11 +444,11 @@ async def cmd_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 
 async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Zero-inference stats — reads SQLite token log directly."""
+    """Zero-inference stats — reads the SQLite token-log summary directly."""
     if not _is_allowed(update):
         return await _unauthorized(update)
 
-    import sqlite3
+    import inference
 
     db_path = TOKEN_LOG_DB
     if not db_path.exists():
@@ -460,29 +456,15 @@ async def cmd_stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        conn = sqlite3.connect(db_path)
-        rows = conn.execute("""
-            SELECT
-                provider,
-                model,
-                COUNT(*)        AS calls,
-                SUM(tokens_in)  AS tok_in,
-                SUM(tokens_out) AS tok_out,
-                SUM(cost)       AS cost
-            FROM token_log
-            GROUP BY provider, model
-            ORDER BY cost DESC
-        """).fetchall()
-
-        totals = conn.execute("""
-            SELECT
-                COUNT(*)        AS calls,
-                SUM(tokens_in)  AS tok_in,
-                SUM(tokens_out) AS tok_out,
-                SUM(cost)       AS cost
-            FROM token_log
-        """).fetchone()
-        conn.close()
+        # In-memory per-model totals; only the first read (seeding them from
+        # token_log_summary) touches disk, hence the worker thread
+        rows = await asyncio.to_thread(inference.usage_by_model)
+        totals = (
+            sum(r[2] for r in rows),
+            sum(r[3] or 0 for r in rows),
+            sum(r[4] or 0 for r in rows),
+            sum(r[5] or 0 for r in rows),
+        )
     except Exception as exc:
         await update.effective_message.reply_text(f"❌ DB error: {exc}")
         return
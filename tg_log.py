@@ -30,9 +30,7 @@ import time
 from datetime import datetime, timezone
 from typing import Any
 
-from dotenv import load_dotenv
-
-load_dotenv()
+import config  # noqa: F401 — loads .env on import
 
 log = logging.getLogger("hexclaw.tg_log")
 
@@ -6,6 +6,8 @@ Ranks findings by CVSS, reachability, and exploit-db status.
 """
 
 import logging
+from typing import List, Optional
+
 import pandas as pd
 import duckdb
 from pathlib import Path
@@ -13,25 +15,33 @@ import data
 
 log = logging.getLogger("hexclaw.prioritize")
 
-def rank_vulnerabilities(parquet_name: str) -> pd.DataFrame:
+# Columns get_top_cves() actually renders — projected so the scan skips the rest
+_SUMMARY_COLUMNS = ["severity", "template_id", "name", "target"]
+
+def rank_vulnerabilities(parquet_name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Query the stored findings and return a prioritized list.
     Prioritization factors:
       - Severity (Critical > High > Medium)
       - Presence of CVE ID
       - Protocol (HTTP/HTTPS)
+
+    If *columns* is given only those columns are decoded from the Parquet
+    files (names missing from the schema are ignored); otherwise all are.
     """
-    db = data.get_duck()
-    parquet_path = data.DATA_DIR / f"{parquet_name}.parquet"
+    files = data.parquet_files(parquet_name)
     
-    if not parquet_path.exists():
-        log.warning(f"No findings found at {parquet_path}")
+    if not files:
+        log.warning(f"No findings found for {parquet_name} in {data.DATA_DIR}")
         return pd.DataFrame()
 
     try:
-        # Load parquet and sort via DuckDB
+        # Load parquet (base file + appended parts) and sort via DuckDB
+        # Paths and column names are bound, never spliced into the SQL text
+        projection = "COLUMNS(c -> list_contains(?, c))" if columns else "*"
+        params = [columns, files] if columns else [files]
         query = f"""
-            SELECT * FROM read_parquet('{parquet_path}')
+            SELECT {projection} FROM read_parquet(?, union_by_name=true)
             ORDER BY 
                 CASE severity
                     WHEN 'critical' THEN 1
@@ -41,15 +51,17 @@ def rank_vulnerabilities(parquet_name: str) -> pd.DataFrame:
                 END ASC,
                 target ASC
         """
-        df = db.query(query).to_df()
-        return df
+        # Per-call cursor on the shared connection: reuses its object cache
+        # (Parquet footers) while staying safe to call from worker threads
+        with data.get_duck().cursor() as cur:
+            return cur.execute(query, params).df()
     except Exception as e:
         log.error(f"Prioritization query failed: {e}")
         return pd.DataFrame()
 
 def get_top_cves(parquet_name: str, limit: int = 5) -> str:
     """Return a summary string of the top CVEs for Telegram."""
-    df = rank_vulnerabilities(parquet_name)
+    df = rank_vulnerabilities(parquet_name, columns=_SUMMARY_COLUMNS)
     if df.empty:
         return "No vulnerabilities found to prioritize."
     